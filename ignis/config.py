@@ -1,6 +1,12 @@
+import hashlib
+import json
 import os
 import threading
+from pathlib import Path
+from collections import OrderedDict
+from gi.repository import GLib
 from ignis import utils
+
 from ignis.services.wallpaper import WallpaperService
 from modules import (
     Bar,
@@ -21,37 +27,52 @@ css_manager = CssManager.get_default()
 WallpaperService.get_default()
 
 # Debounce mechanism
-_css_update_timer = None
-_css_update_lock = threading.Lock()
-
-def write_user_colors_scss():
-    """Write dynamic user color variables to scss/_user_colors.scss"""
-    scss_colors = ""
-    for key, value in user_options.material.colors.items():
-        scss_colors += f"${key}: {value};\n"
-    scss_colors += f"$darkmode: {str(user_options.material.dark_mode).lower()};\n"
-
-    scss_dir = os.path.join(utils.get_current_dir(), "scss")
-    if not os.path.exists(scss_dir):
-        os.makedirs(scss_dir)
-    colors_path = os.path.join(scss_dir, "_user_colors.scss")
-    with open(colors_path, "w") as f:
-        f.write(scss_colors)
+_css_update_source_id = None
+
+# Cache of compiled CSS keyed by SCSS source + active colors (sass compilation
+# dominates reload latency, so identical inputs should never recompile)
+_CSS_CACHE_MAX_ENTRIES = 16
+_css_cache: OrderedDict[str, str] = OrderedDict()
+
+# Last SCSS string written to _user_colors.scss, to skip redundant writes
+_last_colors_scss: str | None = None
+
+def write_user_colors_scss() -> bool:
+    """Write dynamic user color variables to scss/_user_colors.scss.
+
+    Returns True if the file content changed (and was rewritten), False if the
+    generated SCSS is identical to what was last written.
+    """
+    global _last_colors_scss
+
+    lines = [f"${key}: {value};" for key, value in user_options.material.colors.items()]
+    lines.append(f"$darkmode: {str(user_options.material.dark_mode).lower()};")
+    scss_colors = "\n".join(lines) + "\n"
+
+    if scss_colors == _last_colors_scss:
+        return False
+
+    scss_dir = Path(utils.get_current_dir()) / "scss"
+    scss_dir.mkdir(parents=True, exist_ok=True)
+    (scss_dir / "_user_colors.scss").write_text(scss_colors)
+    _last_colors_scss = scss_colors
+    return True
 
 def debounced_css_update():
     """Debounced CSS update to prevent infinite loops"""
-    global _css_update_timer
-    
-    with _css_update_lock:
-        if _css_update_timer:
-            _css_update_timer.cancel()
-        
-        def update_css():
-            write_user_colors_scss()
+    global _css_update_source_id
+
+    if _css_update_source_id is not None:
+        GLib.source_remove(_css_update_source_id)
+
+    def update_css():
+        global _css_update_source_id
+        _css_update_source_id = None
+        if write_user_colors_scss():
             css_manager.reload_css("main")
-        
-        _css_update_timer = threading.Timer(0.2, update_css)  # 200ms delay
-        _css_update_timer.start()
+        return GLib.SOURCE_REMOVE
+
+    _css_update_source_id = GLib.timeout_add(200, update_css)
 
 def patch_style_scss(path: str) -> str:
     with open(path) as file:
@@ -59,9 +80,29 @@ def patch_style_scss(path: str) -> str:
 
     # Don't call write_user_colors_scss here to avoid loops
     # It should be called before this function is triggered
-    return utils.sass_compile(
+    cache_key = hashlib.blake2b(
+        (
+            contents
+            + json.dumps(user_options.material.colors, sort_keys=True)
+            + str(user_options.material.dark_mode)
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+    cached = _css_cache.get(cache_key)
+    if cached is not None:
+        _css_cache.move_to_end(cache_key)
+        return cached
+
+    # style.scss uses the dart-sass module system (@use), which libsass
+    # never implemented — the CLI compiler is the only one that works here
+    compiled = utils.sass_compile(
         string=contents, extra_args=["--load-path", utils.get_current_dir()]
     )
+    _css_cache[cache_key] = compiled
+    while len(_css_cache) > _CSS_CACHE_MAX_ENTRIES:
+        _css_cache.popitem(last=False)
+    return compiled
 
 # Initial write of user colors
 write_user_colors_scss()
@@ -79,12 +120,15 @@ user_options.material.connect("changed", lambda *args: debounced_css_update())
 
 icon_manager.add_icons(os.path.join(utils.get_current_dir(), "icons"))
 
-utils.exec_sh("gsettings set org.gnome.desktop.interface gtk-theme Material")
-utils.exec_sh("gsettings set org.gnome.desktop.interface icon-theme Papirus")
-utils.exec_sh(
-    'gsettings set org.gnome.desktop.interface font-name "JetBrains Mono Regular 11"'
-)
-utils.exec_sh("hyprctl reload")
+# These commands are independent of each other, so run them concurrently
+# instead of serializing four fork/exec round-trips at import time
+for _cmd in (
+    "gsettings set org.gnome.desktop.interface gtk-theme Material",
+    "gsettings set org.gnome.desktop.interface icon-theme Papirus",
+    'gsettings set org.gnome.desktop.interface font-name "JetBrains Mono Regular 11"',
+    "hyprctl reload",
+):
+    threading.Thread(target=utils.exec_sh, args=(_cmd,), daemon=True).start()
 
 ControlCenter()
 
@@ -1,6 +1,9 @@
 import os
-import json
 import logging
+import weakref
+from pathlib import Path
+
+import orjson
 from typing import List, Dict, Optional
 from gi.repository import GLib, Gtk, Gdk, Gio
 from ignis import widgets
@@ -18,7 +21,63 @@ applications = ApplicationsService.get_default()
 window_manager = WindowManager.get_default()
 _preview_manager = get_preview_manager()
 
-CONFIG_PATH = os.path.expanduser("~/.config/ignis/app_order.json")
+CONFIG_PATH = Path("~/.config/ignis/app_order.json").expanduser()
+
+
+# Icon theme lookups do directory scans and pixbuf decoding; cache results
+# per (icon_name, size) and drop the cache when the theme changes
+_ICON_THEME_CACHE: Dict[tuple, Gdk.Paintable] = {}
+_icon_theme = None
+
+
+def _get_icon_theme() -> Gtk.IconTheme:
+    global _icon_theme
+    if _icon_theme is None:
+        display = Gdk.Display.get_default()
+        _icon_theme = Gtk.IconTheme.get_for_display(display)
+        _icon_theme.connect("changed", lambda *_: _ICON_THEME_CACHE.clear())
+    return _icon_theme
+
+
+def _lookup_themed_icon(icon_name: str, size: int):
+    paintable = _ICON_THEME_CACHE.get((icon_name, size))
+    if paintable is None:
+        try:
+            paintable = _get_icon_theme().lookup_icon(
+                icon_name, None, size, 1, Gtk.TextDirection.LTR, 0
+            )
+        except Exception as e:
+            logger.debug(f"Failed to load icon {icon_name}: {e}")
+        if paintable:
+            _ICON_THEME_CACHE[(icon_name, size)] = paintable
+    return paintable
+
+
+def _load_drag_icon(app: Application):
+    """Load a drag icon paintable for an app (file I/O + theme lookup)."""
+    paintable = None
+    icon_path = getattr(app, "icon_path", None)
+    if icon_path and os.path.isfile(icon_path):
+        try:
+            file = Gio.File.new_for_path(icon_path)
+            paintable = Gdk.Texture.new_from_file(file)
+        except Exception as e:
+            logger.debug(f"Failed to load icon from path {icon_path}: {e}")
+
+    if paintable is None:
+        for icon_name in (app.icon, "application-x-executable"):
+            paintable = _lookup_themed_icon(icon_name, 24)
+            if paintable:
+                break
+
+    return paintable
+
+
+def _preload_drag_icon(app: Application) -> bool:
+    """Idle callback: load the drag icon ahead of the first drag."""
+    if getattr(app, "_preloaded_icon", None) is None:
+        app._preloaded_icon = _load_drag_icon(app)
+    return False
 
 
 class DragDropMixin:
@@ -27,28 +86,7 @@ class DragDropMixin:
     def create_drag_icon(self, app: Application, drag_source) -> None:
         paintable = getattr(app, "_preloaded_icon", None)
         if not paintable:
-            icon_path = getattr(app, "icon_path", None)
-            if icon_path and os.path.isfile(icon_path):
-                try:
-                    file = Gio.File.new_for_path(icon_path)
-                    paintable = Gdk.Texture.new_from_file(file)
-                except Exception as e:
-                    logger.debug(f"Failed to load icon from path {icon_path}: {e}")
-
-            if paintable is None:
-                display = Gdk.Display.get_default()
-                icon_theme = Gtk.IconTheme.get_for_display(display)
-                icon_names = [app.icon, "application-x-executable"]
-                for icon_name in icon_names:
-                    try:
-                        paintable = icon_theme.lookup_icon(
-                            icon_name, None, 24, 1, Gtk.TextDirection.LTR, 0
-                        )
-                        if paintable:
-                            break
-                    except Exception as e:
-                        logger.debug(f"Failed to load icon {icon_name}: {e}")
-
+            paintable = _load_drag_icon(app)
             app._preloaded_icon = paintable
 
         if paintable:
@@ -81,6 +119,14 @@ class DragDropMixin:
 class PinnedAppGroup(widgets.Button, DragDropMixin):
     CLICK_DELAY_MS = 150
 
+    # Preview layout constants, hoisted so hover doesn't re-bind them per call
+    ICON_WIDTH = 32
+    PREVIEW_WIDTH = 250
+    PREVIEW_HEIGHT = 170
+    MAX_COLUMNS = 3
+    SPACING = 8
+    VERTICAL_MARGIN = 8
+
     def __init__(self, app: Application, app_container: 'Apps'):
         super().__init__()
         self._app = app
@@ -103,13 +149,12 @@ class PinnedAppGroup(widgets.Button, DragDropMixin):
         self._count_label = widgets.Label(css_classes=["taskbar-count-badge"], visible=False)
         self._icon_box.append(self._count_label)
 
-        # Create menu without model initially - will be set when badge info is available
-        self._menu = widgets.PopoverMenu()
-        main_box = widgets.Box()
-        main_box.append(self._icon_box)
-        main_box.append(self._menu)
+        # Menu is built lazily on first right-click - most icons are never right-clicked
+        self._menu = None
+        self._main_box = widgets.Box()
+        self._main_box.append(self._icon_box)
 
-        self.child = main_box
+        self.child = self._main_box
         self.css_classes = ["taskbar-pinned-apps", "unset"]
 
     def _build_menu_model(self):
@@ -162,22 +207,33 @@ class PinnedAppGroup(widgets.Button, DragDropMixin):
         self.setup_drop_target(self, self._on_drop)
 
     def update_badge(self, badge_info: BadgeInfo) -> None:
+        # Skip the idle round-trip entirely when nothing changed
+        if badge_info == self._current_badge_info:
+            return
         self._current_badge_info = badge_info
         def _update():
             if badge_info.visible and badge_info.count > 0:
-                self._count_label.set_label(str(badge_info.count))
-                self._count_label.set_visible(True)
+                label = str(badge_info.count)
+                visible = True
             else:
-                self._count_label.set_label("")
-                self._count_label.set_visible(False)
-        
+                label = ""
+                visible = False
+            if label != getattr(self, "_last_label", None):
+                self._count_label.set_label(label)
+                self._last_label = label
+            self._count_label.set_visible(visible)
+
         GLib.idle_add(_update)
 
     def _show_menu(self):
         """Show context menu, building it on-demand with current badge info"""
+        if self._menu is None:
+            self._menu = widgets.PopoverMenu()
+            self._main_box.append(self._menu)
+
         windows = self._current_badge_info.windows if self._current_badge_info else []
         window_count = self._current_badge_info.count if self._current_badge_info else 0
-        
+
         menu_model = TaskbarUtils.build_app_context_menu(
             app=self._app,
             window_count=window_count,
@@ -223,10 +279,13 @@ class PinnedAppGroup(widgets.Button, DragDropMixin):
         self.remove_css_class("drag-hover")
         return False
 
+    def _is_menu_visible(self) -> bool:
+        return self._menu is not None and self._menu.is_visible()
+
     # Hover preview
     def _on_hover_enter(self, controller=None, x=None, y=None):
         self._is_hovering = True
-        if self._current_badge_info and self._current_badge_info.windows and not self._is_dragging and not self._menu.is_visible():
+        if self._current_badge_info and self._current_badge_info.windows and not self._is_dragging and not self._is_menu_visible():
             _preview_manager.cancel_scheduled_hide(self._app.id)
             GLib.idle_add(self._schedule_preview_show)
 
@@ -236,19 +295,14 @@ class PinnedAppGroup(widgets.Button, DragDropMixin):
             return 0, 0
         x, y = self.translate_coordinates(root, 0, 0)
         alloc = root.get_allocation()
-        ICON_WIDTH = 32
-        PREVIEW_WIDTH = 250
-        PREVIEW_HEIGHT = 170
-        MAX_COLUMNS = 3
-        SPACING = 8
-        VERTICAL_MARGIN = 8
         num_windows = len(self._current_badge_info.windows)
-        num_columns = min(num_windows, MAX_COLUMNS)
-        num_rows = (num_windows + MAX_COLUMNS - 1) // MAX_COLUMNS
-        total_width = num_columns * PREVIEW_WIDTH + (num_columns - 1) * SPACING
-        total_height = num_rows * PREVIEW_HEIGHT + (num_rows - 1) * SPACING
-        preview_x = alloc.x + x - ((total_width - ICON_WIDTH) // 2)
-        preview_y = alloc.y + y + VERTICAL_MARGIN
+        if num_windows == 1:
+            preview_x = alloc.x + x - ((self.PREVIEW_WIDTH - self.ICON_WIDTH) // 2)
+            return preview_x, alloc.y + y + self.VERTICAL_MARGIN
+        num_columns = min(num_windows, self.MAX_COLUMNS)
+        total_width = num_columns * self.PREVIEW_WIDTH + (num_columns - 1) * self.SPACING
+        preview_x = alloc.x + x - ((total_width - self.ICON_WIDTH) // 2)
+        preview_y = alloc.y + y + self.VERTICAL_MARGIN
         return preview_x, preview_y
 
     def _schedule_preview_show(self) -> bool:
@@ -257,7 +311,7 @@ class PinnedAppGroup(widgets.Button, DragDropMixin):
             and self._current_badge_info 
             and self._current_badge_info.windows 
             and not self._is_dragging
-            and not self._menu.is_visible()   # <-- New check
+            and not self._is_menu_visible()   # <-- New check
         ):
             root_widget = self.get_root()
             if root_widget:
@@ -321,7 +375,7 @@ class AnchorDropTarget(widgets.Box, DragDropMixin):
 
 
 class AppOrderManager:
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: Path):
         self._config_path = config_path
         self._order: List[str] = []
         self._save_scheduled = False
@@ -329,17 +383,16 @@ class AppOrderManager:
 
     def _load_order(self) -> None:
         try:
-            if os.path.exists(self._config_path):
-                with open(self._config_path, "r") as f:
-                    data = json.load(f)
-                if isinstance(data, list) and all(isinstance(item, str) for item in data):
-                    self._order = data
-                else:
-                    logger.warning("Invalid app order format, resetting to empty")
-                    self._order = []
+            with open(self._config_path, "rb") as f:
+                data = orjson.loads(f.read())
+            if isinstance(data, list) and all(isinstance(item, str) for item in data):
+                self._order = data
             else:
+                logger.warning("Invalid app order format, resetting to empty")
                 self._order = []
-        except (json.JSONDecodeError, IOError) as e:
+        except FileNotFoundError:
+            self._order = []
+        except (orjson.JSONDecodeError, IOError) as e:
             logger.error(f"Failed to load app order: {e}")
             self._order = []
 
@@ -351,29 +404,39 @@ class AppOrderManager:
     def _perform_save(self) -> bool:
         self._save_scheduled = False
         try:
-            os.makedirs(os.path.dirname(self._config_path), exist_ok=True)
-            with open(self._config_path, "w") as f:
-                json.dump(self._order, f, indent=2)
+            self._config_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so a crash can't truncate the order
+            tmp_path = self._config_path.with_name(self._config_path.name + ".tmp")
+            tmp_path.write_bytes(orjson.dumps(self._order, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self._config_path)
         except (IOError, OSError) as e:
             logger.error(f"Failed to save app order: {e}")
         return False
 
     def sync_with_pinned_apps(self, pinned_apps: List[Application]) -> None:
         current_pinned_ids = {app.id for app in pinned_apps}
-        self._order = [app_id for app_id in self._order if app_id in current_pinned_ids]
-        for app in pinned_apps:
-            if app.id not in self._order:
-                self._order.append(app.id)
-        self.save_order()
+        new_order = [app_id for app_id in self._order if app_id in current_pinned_ids]
+        known_ids = set(new_order)
+        new_order.extend(
+            app.id for app in pinned_apps if app.id not in known_ids
+        )
+        # The pinned signal can fire repeatedly with identical state during
+        # startup; only schedule a save when the order actually changed
+        if new_order != self._order:
+            self._order = new_order
+            self.save_order()
 
     def get_ordered_apps(self, pinned_apps: List[Application]) -> List[Application]:
         apps_dict = {app.id: app for app in pinned_apps}
         ordered_apps = []
+        seen_ids = set()
         for app_id in self._order:
-            if app_id in apps_dict:
+            if app_id in apps_dict and app_id not in seen_ids:
+                seen_ids.add(app_id)
                 ordered_apps.append(apps_dict[app_id])
         for app in pinned_apps:
-            if app not in ordered_apps:
+            if app.id not in seen_ids:
+                seen_ids.add(app.id)
                 ordered_apps.append(app)
         return ordered_apps
 
@@ -400,13 +463,25 @@ class Apps(widgets.Box):
         self._order_manager = AppOrderManager(CONFIG_PATH)
         self._pinned_app_widgets: Dict[str, PinnedAppGroup] = {}
         self._update_scheduled = False
+        self._badge_update_scheduled = False
+        self._latest_window_state: Optional[WindowState] = None
 
         self._setup_event_handlers()
         self._initial_setup()
 
     def _setup_event_handlers(self) -> None:
         applications.connect("notify::pinned", self._on_pinned_changed)
-        self._window_detector.subscribe(self._on_window_state_changed)
+        # Subscribe through a WeakMethod so the detector's subscriber set can't
+        # keep a dead Apps (and all its widgets) alive after monitor changes
+        weak_callback = weakref.WeakMethod(self._on_window_state_changed)
+
+        def _on_state(window_state, _ref=weak_callback):
+            callback = _ref()
+            if callback is not None:
+                callback(window_state)
+
+        self._wd_subscription = _on_state
+        self._window_detector.subscribe(self._wd_subscription)
 
     def _initial_setup(self) -> None:
         self._order_manager.sync_with_pinned_apps(list(applications.pinned))
@@ -417,7 +492,17 @@ class Apps(widgets.Box):
         self._schedule_update()
 
     def _on_window_state_changed(self, window_state: WindowState) -> None:
-        GLib.idle_add(self._update_badges, window_state)
+        # Coalesce bursts of window events into one badge recompute per frame
+        self._latest_window_state = window_state
+        if not self._badge_update_scheduled:
+            self._badge_update_scheduled = True
+            GLib.timeout_add(16, self._flush_badges)
+
+    def _flush_badges(self) -> bool:
+        self._badge_update_scheduled = False
+        if self._latest_window_state is not None:
+            self._update_badges(self._latest_window_state)
+        return False
 
     def _schedule_update(self) -> None:
         if not self._update_scheduled:
@@ -436,23 +521,30 @@ class Apps(widgets.Box):
     def _update_badges(self, window_state: WindowState) -> None:
         pinned_apps = list(applications.pinned)
         badges = self._badge_counter.compute_badges_for_apps(window_state, pinned_apps)
-        for app in pinned_apps:
-            widget = self._pinned_app_widgets.get(app.id)
-            badge_info = badges.get(app.id)
-            if widget and badge_info:
+        # badges is already keyed by app id; one widget lookup per entry
+        for app_id, badge_info in badges.items():
+            widget = self._pinned_app_widgets.get(app_id)
+            if widget:
                 widget.update_badge(badge_info)
 
     def _refresh_pinned_apps(self) -> None:
-        old_widgets = list(self._pinned_app_widgets.values())
-        self._pinned_app_widgets.clear()
+        old_widgets = self._pinned_app_widgets
         pinned_apps = self._order_manager.get_ordered_apps(list(applications.pinned))
+        new_ids = {app.id for app in pinned_apps}
+
+        # Reuse existing widgets; only build PinnedAppGroups for newly pinned apps
+        self._pinned_app_widgets = {}
         widgets_list = []
 
         if pinned_apps:
             widgets_list.append(AnchorDropTarget(self, pinned_apps[0].id))
 
         for i, app in enumerate(pinned_apps):
-            app_widget = PinnedAppGroup(app, self)
+            app_widget = old_widgets.get(app.id)
+            if app_widget is None:
+                app_widget = PinnedAppGroup(app, self)
+                # Warm the drag icon off the hot path so the first drag doesn't hitch
+                GLib.idle_add(_preload_drag_icon, app, priority=GLib.PRIORITY_LOW)
             self._pinned_app_widgets[app.id] = app_widget
             widgets_list.append(app_widget)
             if i + 1 < len(pinned_apps):
@@ -463,8 +555,9 @@ class Apps(widgets.Box):
 
         self.child = widgets_list
 
-        for widget in old_widgets:
-            widget.cleanup()
+        for app_id, widget in old_widgets.items():
+            if app_id not in new_ids:
+                widget.cleanup()
 
         current_state = self._window_detector.get_current_state()
         GLib.idle_add(self._update_badges, current_state)
@@ -481,7 +574,7 @@ class Apps(widgets.Box):
 
     def cleanup(self) -> None:
         try:
-            self._window_detector.unsubscribe(self._on_window_state_changed)
+            self._window_detector.unsubscribe(self._wd_subscription)
         except Exception as e:
             logger.error(f"Failed to unsubscribe from window detector: {e}")
         for widget in self._pinned_app_widgets.values():
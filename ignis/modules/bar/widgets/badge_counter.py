@@ -1,3 +1,4 @@
+import sys
 from typing import Dict, List, Any
 from ignis.services.applications import Application
 
@@ -6,12 +7,26 @@ from .window_detector import WindowState
 
 class BadgeInfo:
     """Represents badge information for an app"""
-    def __init__(self, app: Application, count: int = 0, windows: List[Any] = None):
+
+    __slots__ = ("app", "count", "windows", "visible")
+
+    def __init__(self, app: Application, count: int = 0, windows: tuple = ()):
         self.app = app
         self.count = count
-        self.windows = windows or []
+        self.windows = windows
         self.visible = count > 0
 
+    def __eq__(self, other):
+        """Equality lets widgets skip no-op badge updates during window churn"""
+        if not isinstance(other, BadgeInfo):
+            return NotImplemented
+        return (
+            self.count == other.count
+            and self.visible == other.visible
+            and self.windows == other.windows
+            and getattr(self.app, "id", None) == getattr(other.app, "id", None)
+        )
+
 
 class BadgeCounter:
     """
@@ -21,7 +36,7 @@ class BadgeCounter:
     
     def __init__(self):
         self._cached_badges: Dict[str, BadgeInfo] = {}
-        self._last_state_time: float = 0
+        self._cache_key = None
     
     def compute_badges_for_apps(self, window_state: WindowState, apps: List[Application]) -> Dict[str, BadgeInfo]:
         """
@@ -32,21 +47,21 @@ class BadgeCounter:
             apps: List of applications to compute badges for
             
         Returns:
-            Dict mapping app.id -> BadgeInfo
+            Dict mapping app.id -> BadgeInfo. The returned mapping is shared
+            with the cache and must not be mutated by callers.
         """
-        # Use cached result if state unchanged
-        if window_state.last_update_time == self._last_state_time:
-            return self._cached_badges.copy()
-        
-        self._last_state_time = window_state.last_update_time
+        # Use cached result if state and app list are unchanged; returning the
+        # cached dict by reference avoids a copy per refresh on the hot path
+        cache_key = (window_state.last_update_time, tuple(app.id for app in apps))
+        if cache_key == self._cache_key:
+            return self._cached_badges
+
         badges = {}
-        
         for app in apps:
-            badge_info = self._compute_badge_for_app(app, window_state)
-            badges[app.id] = badge_info
-        
-        # Update cache
-        self._cached_badges = badges.copy()
+            badges[sys.intern(app.id)] = self._compute_badge_for_app(app, window_state)
+
+        self._cache_key = cache_key
+        self._cached_badges = badges
         return badges
     
     def compute_badge_for_app(self, app: Application, window_state: WindowState) -> BadgeInfo:
@@ -58,19 +73,13 @@ class BadgeCounter:
     def _compute_badge_for_app(self, app: Application, window_state: WindowState) -> BadgeInfo:
         """Internal method to compute badge for an app"""
         if not app or not window_state.app_groups:
-            return BadgeInfo(app, 0, [])
-        
-        total_count = 0
+            return BadgeInfo(app, 0, ())
+
         all_windows = []
-        
-        # Look through all app groups to find windows that match this app
-        for group_key, group_data in window_state.app_groups.items():
-            if group_data["app"].id == app.id:
-                windows = group_data["windows"]
-                total_count += len(windows)
-                all_windows.extend(windows)
-        
-        return BadgeInfo(app, total_count, all_windows)
+        for group_data in window_state.app_groups_by_app_id.get(app.id, ()):
+            all_windows.extend(group_data["windows"])
+
+        return BadgeInfo(app, len(all_windows), tuple(all_windows))
     
     def get_app_window_groups(self, app: Application, window_state: WindowState) -> Dict[str, Dict]:
         """
@@ -78,13 +87,11 @@ class BadgeCounter:
         """
         if not app or not window_state.app_groups:
             return {}
-        
-        app_groups = {}
-        for group_key, group_data in window_state.app_groups.items():
-            if group_data["app"].id == app.id:
-                app_groups[group_key] = group_data
-        
-        return app_groups
+
+        matching = window_state.app_groups_by_app_id.get(app.id)
+        if not matching:
+            return {}
+        return {group_data["group_key"]: group_data for group_data in matching}
     
     def get_running_apps_badges(self, window_state: WindowState, exclude_pinned: bool = True) -> Dict[str, BadgeInfo]:
         """
@@ -93,36 +100,35 @@ class BadgeCounter:
         if not window_state.app_groups:
             return {}
         
-        badges = {}
-        
-        for group_key, group_data in window_state.app_groups.items():
+        # Accumulate per-app window lists first, then freeze into BadgeInfos;
+        # bind attributes once per iteration to keep the loop lean
+        accumulated: Dict[str, tuple] = {}
+        for group_data in window_state.app_groups.values():
             app = group_data["app"]
-            
+
             # Skip pinned apps if requested
             if exclude_pinned and app.is_pinned:
                 continue
-            
-            # If we already have this app, add to its count
-            if app.id in badges:
-                badges[app.id].count += len(group_data["windows"])
-                badges[app.id].windows.extend(group_data["windows"])
+
+            # App ids are few and long-lived; interning caches their hashes
+            # and lets dict probes compare by pointer
+            app_id = sys.intern(app.id)
+            windows = group_data["windows"]
+            entry = accumulated.get(app_id)
+            if entry is None:
+                accumulated[app_id] = (app, list(windows))
             else:
-                badges[app.id] = BadgeInfo(
-                    app, 
-                    len(group_data["windows"]), 
-                    group_data["windows"].copy()
-                )
-        
-        # Update visibility
-        for badge in badges.values():
-            badge.visible = badge.count > 0
-        
-        return badges
+                entry[1].extend(windows)
+
+        return {
+            app_id: BadgeInfo(app, len(windows), tuple(windows))
+            for app_id, (app, windows) in accumulated.items()
+        }
     
     def clear_cache(self):
         """Clear cached badge information"""
-        self._cached_badges.clear()
-        self._last_state_time = 0
+        self._cached_badges = {}
+        self._cache_key = None
 
 
 # Global instance
@@ -0,0 +1,144 @@
+import os
+import socket
+import selectors
+import threading
+import logging
+from typing import Callable, Dict, List
+
+logger = logging.getLogger("HyprIPC")
+
+# Event socket path resolved once at module load instead of per connection;
+# None outside a Hyprland session, reported when the listener first starts
+_HYPR_SOCK2 = None
+if os.environ.get("XDG_RUNTIME_DIR") and os.environ.get("HYPRLAND_INSTANCE_SIGNATURE"):
+    _HYPR_SOCK2 = os.path.join(
+        os.environ["XDG_RUNTIME_DIR"],
+        "hypr",
+        os.environ["HYPRLAND_INSTANCE_SIGNATURE"],
+        ".socket2.sock",
+    )
+
+
+class HyprIPC:
+    """
+    Process-wide listener on Hyprland's event socket (.socket2.sock).
+    A single connection serves every consumer; each event is fanned out
+    only to callbacks registered for its type.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callable[[str, str], None]]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        # Self-pipe so stop() can wake the selector instantly instead of
+        # leaving the thread parked in a blocking read
+        self._wakeup_r = None
+        self._wakeup_w = None
+
+    def subscribe(self, event_type: str, callback: Callable[[str, str], None]):
+        """Register a callback for an event type; "" receives all events"""
+        with self._lock:
+            self._subscribers.setdefault(event_type, []).append(callback)
+        self._start()
+
+    def unsubscribe(self, event_type: str, callback: Callable[[str, str], None]):
+        """Remove a callback; the listener stops once nobody is subscribed"""
+        stop_listener = False
+        with self._lock:
+            callbacks = self._subscribers.get(event_type)
+            if callbacks and callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._subscribers[event_type]
+            stop_listener = not self._subscribers
+        if stop_listener:
+            self._stop()
+
+    def _start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._listener_thread, daemon=True)
+        self._thread.start()
+        logger.info("Hyprland IPC listener started")
+
+    def _stop(self):
+        self._stop_event.set()
+        if self._wakeup_w is not None:
+            try:
+                os.write(self._wakeup_w, b"x")
+            except OSError:
+                pass
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        logger.info("Hyprland IPC listener stopped")
+
+    def _dispatch(self, event_type: str, event_data: str):
+        with self._lock:
+            callbacks = list(self._subscribers.get(event_type, ()))
+            callbacks += self._subscribers.get("", ())
+        for callback in callbacks:
+            try:
+                callback(event_type, event_data)
+            except Exception as e:
+                logger.error(f"Error in IPC event callback: {e}")
+
+    def _listener_thread(self):
+        if _HYPR_SOCK2 is None:
+            logger.error("Missing required environment variables for Hyprland socket")
+            return
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(_HYPR_SOCK2)
+            sock.setblocking(False)
+        except Exception as e:
+            logger.error(f"Failed to connect to Hyprland IPC socket: {e}")
+            return
+
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        selector.register(self._wakeup_r, selectors.EVENT_READ)
+        buffer = bytearray()
+
+        try:
+            with sock:
+                while not self._stop_event.is_set():
+                    for key, _ in selector.select(timeout=0.25):
+                        if key.fileobj == self._wakeup_r:
+                            os.read(self._wakeup_r, 1)
+                            continue
+                        data = os.read(sock.fileno(), 65536)
+                        if not data:
+                            return
+                        buffer += data
+                        # Events are short ASCII lines; parse on bytes and
+                        # decode only once split, without a TextIOWrapper
+                        while (newline := buffer.find(b"\n")) != -1:
+                            line = bytes(buffer[:newline])
+                            del buffer[:newline + 1]
+                            event_type, sep, event_data = line.partition(b">>")
+                            if sep:
+                                self._dispatch(
+                                    event_type.decode("latin-1"),
+                                    event_data.decode("latin-1"),
+                                )
+        finally:
+            selector.close()
+            os.close(self._wakeup_r)
+            os.close(self._wakeup_w)
+            self._wakeup_r = self._wakeup_w = None
+
+
+# Global instance
+_hypr_ipc = None
+
+
+def get_ipc() -> HyprIPC:
+    """Get the global Hyprland IPC listener instance"""
+    global _hypr_ipc
+    if _hypr_ipc is None:
+        _hypr_ipc = HyprIPC()
+    return _hypr_ipc
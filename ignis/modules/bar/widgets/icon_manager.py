@@ -1,14 +1,27 @@
 import os
-import re
 import subprocess
 import logging
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from configparser import ConfigParser
-from typing import Optional
+from typing import List, Optional
 
 logger = logging.getLogger("IconManager")
 
 
+class DesktopEntry:
+    """Parsed fields of one .desktop file, kept so lookups never reopen it."""
+
+    __slots__ = ("names", "icon_name", "no_display")
+
+    def __init__(self, names: List[str], icon_name: Optional[str], no_display: bool):
+        self.names = names
+        self.icon_name = icon_name
+        self.no_display = no_display
+
+
 class IconManager:
     """XDG spec-compliant Icon manager with DE theme detection and improved caching."""
 
@@ -22,13 +35,27 @@ class IconManager:
 
     _desktop_files_indexed = False
     _desktop_files_index = {}
+    _desktop_prefix_index = {}  # first word of a Name -> desktop_path
+    _desktop_entries = {}  # desktop_path -> DesktopEntry
 
-    _icon_files_index = {}  # theme_name -> {icon_name: icon_path}
+    _icon_files_index = {}  # scan_dir -> {icon_name: icon_path}
     _icon_cache = {}       # Cache icon_name or desktop_file -> icon_path or None
     _desktop_cache = {}    # Cache app_name_lower -> desktop_file_path or None
-    _app_icon_cache = {}   # Cache (app_name, class_name) -> icon_path or None
 
     _current_theme = None
+    _active_indices = None  # per-dir index dicts in priority order
+    _index_lock = threading.Lock()
+    _INDEX_WORKERS = 8
+
+    THEME_CACHE_PATH = os.path.expanduser("~/.cache/ignis/icon_theme")
+    # Config files the theme can come from; their newest mtime invalidates
+    # the on-disk cache
+    THEME_SOURCE_FILES = [
+        os.path.expanduser("~/.config/dconf/user"),
+        os.path.expanduser("~/.config/kdeglobals"),
+        os.path.expanduser("~/.config/gtk-3.0/settings.ini"),
+        os.path.expanduser("~/.config/gtk-4.0/settings.ini"),
+    ]
 
     # --- Icon theme detection section ---
 
@@ -86,20 +113,71 @@ class IconManager:
                     continue
         return None
 
+    @classmethod
+    def _theme_source_mtime(cls) -> float:
+        """Newest mtime of the config files the theme can come from."""
+        mtime = 0.0
+        for path in cls.THEME_SOURCE_FILES:
+            try:
+                mtime = max(mtime, os.stat(path).st_mtime)
+            except OSError:
+                continue
+        return mtime
+
+    @classmethod
+    def _load_cached_theme(cls, source_mtime: float) -> Optional[str]:
+        """Return the persisted theme if the source configs are unchanged."""
+        try:
+            with open(cls.THEME_CACHE_PATH) as f:
+                cached_mtime, _, theme = f.read().strip().partition(" ")
+            if theme and float(cached_mtime) == source_mtime:
+                return theme
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @classmethod
+    def _store_cached_theme(cls, theme: str, source_mtime: float):
+        try:
+            os.makedirs(os.path.dirname(cls.THEME_CACHE_PATH), exist_ok=True)
+            with open(cls.THEME_CACHE_PATH, "w") as f:
+                f.write(f"{source_mtime} {theme}")
+        except OSError as e:
+            logger.debug(f"Failed to persist icon theme cache: {e}")
+
     @classmethod
     def _detect_current_theme(cls) -> str:
         """Detect current icon theme, cache it, use cross-DE detection."""
         if cls._current_theme:
             return cls._current_theme
 
-        theme = (
-            cls._detect_gnome_theme()
-            or cls._detect_kde_theme()
-            or cls._detect_xfce_theme()
-            or cls._detect_gtk_theme()
-            or "hicolor"
-        )
+        source_mtime = cls._theme_source_mtime()
+        cached = cls._load_cached_theme(source_mtime)
+        if cached:
+            cls._current_theme = cached
+            return cached
+
+        # Dispatch straight to the detector for the running desktop, then
+        # try cheap file reads before any subprocess fallback
+        desktop = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
+        theme = None
+        if "gnome" in desktop:
+            theme = cls._detect_gnome_theme()
+        elif "kde" in desktop:
+            theme = cls._detect_kde_theme()
+        elif "xfce" in desktop:
+            theme = cls._detect_xfce_theme()
+
+        if not theme:
+            theme = (
+                cls._detect_kde_theme()
+                or cls._detect_gtk_theme()
+                or cls._detect_gnome_theme()
+                or cls._detect_xfce_theme()
+                or "hicolor"
+            )
         cls._current_theme = theme
+        cls._store_cached_theme(theme, source_mtime)
         logger.debug(f"Detected current icon theme: {theme}")
         return theme
 
@@ -117,61 +195,159 @@ class IconManager:
             cls.ICON_BASE_PATHS.append(os.path.join(d, "icons"))
         cls.ICON_BASE_PATHS.append(cls.PIXMAPS_PATH)
 
+    @staticmethod
+    def _parse_desktop_file(desktop_path: str) -> DesktopEntry:
+        """Extract Name*, Icon and NoDisplay from one desktop file in one pass."""
+        names: List[str] = []
+        icon_name = None
+        no_display = False
+        try:
+            # Stream lines in binary and match on prefixes; a multiline
+            # regex over whole files is far more bytecode per file
+            with open(desktop_path, "rb") as f:
+                in_entry = False
+                for raw_line in f:
+                    line = raw_line.strip()
+                    if line.startswith(b"["):
+                        if in_entry:
+                            break  # left the [Desktop Entry] section
+                        in_entry = line == b"[Desktop Entry]"
+                        continue
+                    if not in_entry:
+                        continue
+                    if line.startswith(b"Name=") or line.startswith(b"Name["):
+                        value = line.split(b"=", 1)[1]
+                        key = value.decode("utf-8", "replace").strip().lower()
+                        if key:
+                            names.append(key)
+                    elif line.startswith(b"Icon="):
+                        icon_name = line[5:].decode("utf-8", "replace").strip() or None
+                    elif line.startswith(b"NoDisplay="):
+                        no_display = line[10:].strip().lower() == b"true"
+        except Exception as e:
+            logger.debug(f"Error reading desktop file {desktop_path}: {e}")
+        return DesktopEntry(names, icon_name, no_display)
+
     @classmethod
     def _index_desktop_files(cls):
-        if cls._desktop_files_indexed:
-            return
-        index = {}
-        for apps_dir in cls.DESKTOP_FILES_PATHS:
-            if not os.path.isdir(apps_dir):
-                continue
-            for desktop_path in glob(os.path.join(apps_dir, "*.desktop")):
-                try:
-                    with open(desktop_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                        names = re.findall(r"^Name(?:\[[^\]]+\])?=(.+)$", content, re.MULTILINE)
-                        for name in names:
-                            key = name.strip().lower()
-                            if key not in index:
-                                index[key] = desktop_path
-                except Exception as e:
-                    logger.debug(f"Error reading desktop file {desktop_path}: {e}")
-        cls._desktop_files_index = index
-        cls._desktop_files_indexed = True
-        logger.debug(f"Indexed {len(index)} desktop files")
+        with cls._index_lock:
+            if cls._desktop_files_indexed:
+                return
+            paths = []
+            for apps_dir in cls.DESKTOP_FILES_PATHS:
+                if os.path.isdir(apps_dir):
+                    paths.extend(glob(os.path.join(apps_dir, "*.desktop")))
+
+            # Parsing is I/O-bound small reads; the GIL is released during the
+            # syscalls, so a thread pool shortens the cold-cache path a lot
+            index = {}
+            prefix_index = {}
+            entries = {}
+            with ThreadPoolExecutor(max_workers=cls._INDEX_WORKERS) as executor:
+                for desktop_path, entry in zip(
+                    paths, executor.map(cls._parse_desktop_file, paths)
+                ):
+                    entries[desktop_path] = entry
+                    if entry.no_display:
+                        continue
+                    for key in entry.names:
+                        if key not in index:
+                            index[key] = desktop_path
+                        first_word = key.split(" ", 1)[0]
+                        if first_word and first_word not in prefix_index:
+                            prefix_index[first_word] = desktop_path
+            cls._desktop_files_index = index
+            cls._desktop_prefix_index = prefix_index
+            cls._desktop_entries = entries
+            cls._desktop_files_indexed = True
+            logger.debug(f"Indexed {len(index)} desktop files")
+
+    # Sizes worth indexing for our fixed pixel_size=32 rendering; anything
+    # else (8x8 ... 512x512, cursors) is dead weight in the index
+    _ICON_SIZE_WHITELIST = {"32x32", "48x48", "64x64", "scalable", "symbolic"}
+
+    @staticmethod
+    def _is_size_dir(name: str) -> bool:
+        head, _, tail = name.partition("x")
+        return head.isdigit() and (not tail or tail.isdigit())
 
     @classmethod
-    def _index_icon_files(cls, theme: str):
-        cls._init_base_paths()
-        if theme in cls._icon_files_index:
+    def _scan_icon_tree(cls, scan_dir: str, found: dict):
+        """Recursively collect icon files using scandir DirEntry types."""
+        try:
+            entries = os.scandir(scan_dir)
+        except OSError:
             return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    cls._scan_icon_tree(entry.path, found)
+                elif entry.is_file():
+                    base, ext = os.path.splitext(entry.name)
+                    if ext.lower() in (".png", ".svg", ".xpm") and base not in found:
+                        found[base] = entry.path
+
+    @classmethod
+    def _scan_icon_dir(cls, scan_dir: str) -> dict:
+        """Scan one icon directory, pruning size subdirectories we never use."""
+        found: dict = {}
+        try:
+            entries = os.scandir(scan_dir)
+        except OSError:
+            return found
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name
+                    if cls._is_size_dir(name) and name not in cls._ICON_SIZE_WHITELIST:
+                        continue
+                    if name == "cursors":
+                        continue
+                    cls._scan_icon_tree(entry.path, found)
+                elif entry.is_file():
+                    base, ext = os.path.splitext(entry.name)
+                    if ext.lower() in (".png", ".svg", ".xpm") and base not in found:
+                        found[base] = entry.path
+        return found
 
-        index = {}
+    @classmethod
+    def _theme_scan_dirs(cls, theme: str) -> List[str]:
+        """Ordered directories to search for a theme (priority first)."""
         search_themes = [theme]
         if theme != "hicolor":
             search_themes.append("hicolor")
 
-        for base_dir in cls.ICON_BASE_PATHS:
-            for theme_name in search_themes:
-                theme_dir = os.path.join(base_dir, theme_name)
-                if not os.path.isdir(theme_dir):
-                    continue
-                for root, _, files in os.walk(theme_dir):
-                    for file in files:
-                        base, ext = os.path.splitext(file)
-                        ext = ext.lower()
-                        if ext in (".png", ".svg", ".xpm") and base not in index:
-                            index[base] = os.path.join(root, file)
-
-        if os.path.isdir(cls.PIXMAPS_PATH):
-            for root, _, files in os.walk(cls.PIXMAPS_PATH):
-                for file in files:
-                    base, ext = os.path.splitext(file)
-                    if ext.lower() in (".png", ".svg", ".xpm") and base not in index:
-                        index[base] = os.path.join(root, file)
-
-        cls._icon_files_index[theme] = index
-        logger.debug(f"Indexed {len(index)} icons for theme {theme}")
+        scan_dirs = [
+            os.path.join(base_dir, theme_name)
+            for base_dir in cls.ICON_BASE_PATHS
+            if base_dir != cls.PIXMAPS_PATH
+            for theme_name in search_themes
+        ]
+        scan_dirs.append(cls.PIXMAPS_PATH)
+        return scan_dirs
+
+    @classmethod
+    def _index_icon_files(cls, theme: str):
+        cls._init_base_paths()
+        with cls._index_lock:
+            # Per-directory sub-indices: hicolor and pixmaps scans are shared
+            # across themes instead of being re-walked per theme index
+            missing = [
+                d for d in cls._theme_scan_dirs(theme)
+                if d not in cls._icon_files_index
+            ]
+            if not missing:
+                return
+
+            # Walks are stat/readdir-bound; scan missing directories in
+            # parallel. No isdir pre-filter: _scan_icon_dir tolerates missing
+            # dirs, which saves one stat syscall per candidate path
+            with ThreadPoolExecutor(max_workers=cls._INDEX_WORKERS) as executor:
+                for scan_dir, found in zip(
+                    missing, executor.map(cls._scan_icon_dir, missing)
+                ):
+                    cls._icon_files_index[scan_dir] = found
+            logger.debug(f"Indexed {len(missing)} icon dirs for theme {theme}")
 
     @classmethod
     def find_desktop_file_by_name(cls, name: str) -> Optional[str]:
@@ -183,34 +359,58 @@ class IconManager:
 
         cls._index_desktop_files()
         desktop_path = cls._desktop_files_index.get(key)
+
+        if desktop_path is None:
+            # Window titles often decorate the app name (" — GIMP",
+            # "(Private)"); retry with shrinking whitespace prefixes
+            tokens = key.replace("—", " ").replace("-", " ").replace("(", " ").split()
+            for end in range(len(tokens) - 1, 0, -1):
+                desktop_path = cls._desktop_files_index.get(" ".join(tokens[:end]))
+                if desktop_path:
+                    break
+            if desktop_path is None and tokens:
+                desktop_path = cls._desktop_prefix_index.get(tokens[0])
+
+        # Cache misses as None so repeated lookups stay O(1)
         cls._desktop_cache[key] = desktop_path
         return desktop_path
 
     @classmethod
     def find_icon_for_desktop(cls, desktop_file: str) -> Optional[str]:
-        if not desktop_file or not os.path.exists(desktop_file):
+        if not desktop_file:
             return None
         if desktop_file in cls._icon_cache:
             return cls._icon_cache[desktop_file]
 
-        try:
-            with open(desktop_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                match = re.search(r"^Icon=(.+)$", content, re.MULTILINE)
-                if not match:
-                    cls._icon_cache[desktop_file] = None
-                    return None
-                icon_name = match.group(1).strip()
-                if os.path.isabs(icon_name) and os.path.exists(icon_name):
-                    cls._icon_cache[desktop_file] = icon_name
-                    return icon_name
-                icon_path = cls.find_icon_by_name(icon_name)
-                cls._icon_cache[desktop_file] = icon_path
-                return icon_path
-        except Exception as e:
-            logger.debug(f"Error reading desktop file {desktop_file}: {e}")
+        # Reuse the Icon= value parsed during indexing; only files outside
+        # the indexed dirs need to be opened again
+        entry = cls._desktop_entries.get(desktop_file)
+        if entry is not None:
+            icon_name = entry.icon_name
+        elif os.path.exists(desktop_file):
+            icon_name = None
+            try:
+                with open(desktop_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.startswith("Icon="):
+                            icon_name = line[5:].strip()
+                            break
+            except Exception as e:
+                logger.debug(f"Error reading desktop file {desktop_file}: {e}")
+                cls._icon_cache[desktop_file] = None
+                return None
+        else:
+            return None
+
+        if not icon_name:
             cls._icon_cache[desktop_file] = None
             return None
+        if os.path.isabs(icon_name) and os.path.exists(icon_name):
+            cls._icon_cache[desktop_file] = icon_name
+            return icon_name
+        icon_path = cls.find_icon_by_name(icon_name)
+        cls._icon_cache[desktop_file] = icon_path
+        return icon_path
 
     @classmethod
     def find_icon_by_name(cls, icon_name: str) -> Optional[str]:
@@ -219,46 +419,93 @@ class IconManager:
         if icon_name in cls._icon_cache:
             return cls._icon_cache[icon_name]
 
-        theme = cls._detect_current_theme()
-        cls._index_icon_files(theme)
-        candidates = cls._icon_files_index.get(theme, {})
-
-        icon_path = candidates.get(icon_name)
-        if not icon_path:
-            for ext in (".png", ".svg", ".xpm"):
-                icon_path = candidates.get(icon_name + ext)
-                if icon_path:
-                    break
+        # Resolve the ordered index list once; afterwards the fast path is
+        # plain dict probes with no theme detection or dispatch overhead
+        indices = cls._active_indices
+        if indices is None:
+            theme = cls._detect_current_theme()
+            cls._index_icon_files(theme)
+            indices = tuple(
+                idx
+                for scan_dir in cls._theme_scan_dirs(theme)
+                if (idx := cls._icon_files_index.get(scan_dir))
+            )
+            cls._active_indices = indices
+
+        icon_path = None
+        for candidates in indices:
+            icon_path = candidates.get(icon_name)
+            if not icon_path:
+                for ext in (".png", ".svg", ".xpm"):
+                    icon_path = candidates.get(icon_name + ext)
+                    if icon_path:
+                        break
+            if icon_path:
+                break
 
         cls._icon_cache[icon_name] = icon_path
         return icon_path
 
     @classmethod
     def get_icon_for_app(cls, app_name: str = None, class_name: str = None) -> Optional[str]:
-        cache_key = (app_name.lower() if app_name else None,
-                     class_name.lower() if class_name else None)
-        if cache_key in cls._app_icon_cache:
-            return cls._app_icon_cache[cache_key]
-
-        icon = None
-        if app_name:
-            desktop_file = cls.find_desktop_file_by_name(app_name)
-            if desktop_file:
-                icon = cls.find_icon_for_desktop(desktop_file)
-
-        if not icon and class_name:
-            icon = cls.find_icon_by_name(class_name)
+        return _resolve_icon(
+            app_name.lower() if app_name else None,
+            class_name.lower() if class_name else None,
+        )
 
-        cls._app_icon_cache[cache_key] = icon
-        return icon
+    @classmethod
+    def warm_up(cls):
+        """Build all indexes ahead of the first lookup."""
+        try:
+            cls._index_desktop_files()
+            cls._index_icon_files(cls._detect_current_theme())
+        except Exception as e:
+            logger.debug(f"Icon index warm-up failed: {e}")
 
     @classmethod
     def clear_cache(cls):
         cls._desktop_cache.clear()
         cls._icon_cache.clear()
-        cls._app_icon_cache.clear()
+        _resolve_icon.cache_clear()
+        lookup_icon_override.cache_clear()
         cls._desktop_files_indexed = False
         cls._desktop_files_index.clear()
+        cls._desktop_prefix_index.clear()
+        cls._desktop_entries.clear()
         cls._icon_files_index.clear()
+        cls._active_indices = None
         cls._current_theme = None
         logger.debug("Cleared all IconManager caches and indexes")
+
+
+@lru_cache(maxsize=512)
+def lookup_icon_override(initial_title: str) -> Optional[str]:
+    """Resolve a window's icon override from its initial title, memoized.
+
+    Runs once per distinct title instead of once per window per refresh;
+    IconManager.clear_cache() invalidates it along with the indexes.
+    """
+    desktop_file = IconManager.find_desktop_file_by_name(initial_title)
+    if desktop_file:
+        return IconManager.find_icon_for_desktop(desktop_file)
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _resolve_icon(app_name_lower: Optional[str], class_name_lower: Optional[str]) -> Optional[str]:
+    """Resolve an icon path for a (name, class) pair; bounded memoization."""
+    icon = None
+    if app_name_lower:
+        desktop_file = IconManager.find_desktop_file_by_name(app_name_lower)
+        if desktop_file:
+            icon = IconManager.find_icon_for_desktop(desktop_file)
+
+    if not icon and class_name_lower:
+        icon = IconManager.find_icon_by_name(class_name_lower)
+
+    return icon
+
+
+# Warm the indexes off the main thread so the first bar render never blocks
+# on readdir/stat bursts over the icon and desktop-file trees
+threading.Thread(target=IconManager.warm_up, daemon=True).start()
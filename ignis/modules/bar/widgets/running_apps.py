@@ -33,12 +33,14 @@ class RunningAppGroup(widgets.Button):
             )
             self._icon_box.append(self._badge_widget)
 
-        # Menu - will be rebuilt dynamically
-        self._menu = widgets.PopoverMenu(model=self._build_menu())
+        # Menu is created lazily on first right-click and rebuilt only when
+        # marked dirty by a badge update
+        self._menu = None
+        self._menu_dirty = True
 
         content_box = widgets.Box()
         content_box.append(self._icon_box)
-        content_box.append(self._menu)
+        self._content_box = content_box
 
         # Hover controller
         self._hover_controller = Gtk.EventControllerMotion()
@@ -69,6 +71,19 @@ class RunningAppGroup(widgets.Button):
             on_close_callback=self._close_all_windows
         )
 
+    def _ensure_menu(self):
+        """Create the popover on first use and refresh its model if stale"""
+        if self._menu is None:
+            self._menu = widgets.PopoverMenu()
+            self._content_box.append(self._menu)
+        if self._menu_dirty:
+            self._menu.set_model(self._build_menu())
+            self._menu_dirty = False
+        return self._menu
+
+    def _is_menu_visible(self) -> bool:
+        return self._menu is not None and self._menu.is_visible()
+
     def update_badge_info(self, new_badge_info: BadgeInfo):
         self._badge_info = new_badge_info
 
@@ -86,10 +101,10 @@ class RunningAppGroup(widgets.Button):
             else:
                 if self._badge_widget:
                     self._badge_widget.set_visible(False)
-            
-            # Rebuild menu with updated badge info
-            self._menu.set_model(self._build_menu())
-        
+
+            # Defer the menu rebuild until it is next opened
+            self._menu_dirty = True
+
         GLib.idle_add(update_widget)
 
     def _toggle_pin(self):
@@ -110,8 +125,8 @@ class RunningAppGroup(widgets.Button):
         if root is None:
             return 0, 0
 
-        x, y = self.translate_coordinates(root, 0, 0)
         alloc = root.get_allocation()
+        x, y = self.translate_coordinates(root, 0, 0)
 
         ICON_WIDTH = 32
         PREVIEW_WIDTH = 250
@@ -134,12 +149,12 @@ class RunningAppGroup(widgets.Button):
 
     def _on_hover_enter(self, controller=None, x=None, y=None):
         self._is_hovering = True
-        if self._badge_info.windows and not self._menu.is_visible():
+        if self._badge_info.windows and not self._is_menu_visible():
             _preview_manager.cancel_scheduled_hide(self._app.id)
             GLib.idle_add(self._schedule_preview_show)
 
     def _schedule_preview_show(self) -> bool:
-        if self._is_hovering and self._badge_info.windows and not self._menu.is_visible():
+        if self._is_hovering and self._badge_info.windows and not self._is_menu_visible():
             root_widget = self.get_root()
             if root_widget:
                 x, y = self._calculate_preview_position()
@@ -167,9 +182,10 @@ class RunningAppGroup(widgets.Button):
         elif button == 3:
             if _preview_manager.is_preview_visible(self._app.id):
                 _preview_manager.hide_preview_for_app(self._app.id)
-            if self._menu.is_visible():
-                GLib.idle_add(self._menu.popdown)
-            GLib.idle_add(self._menu.popup)
+            menu = self._ensure_menu()
+            if menu.is_visible():
+                GLib.idle_add(menu.popdown)
+            GLib.idle_add(menu.popup)
             return True
         return False
 
@@ -187,8 +203,10 @@ class RunningApps(widgets.Box):
         super().__init__(spacing=4)
         self._window_detector = get_window_detector()
         self._badge_counter = get_badge_counter()
-        self._children = []
         self._app_widgets = {}
+        self._last_state_sig = None
+        self._pending_state = None
+        self._flush_scheduled = False
         self._window_detector.subscribe(self._on_window_state_changed)
         applications.connect(
             "notify::pinned", lambda *args: GLib.idle_add(self._refresh_from_current_state)
@@ -197,27 +215,47 @@ class RunningApps(widgets.Box):
         self._update_from_window_state(current_state)
 
     def _on_window_state_changed(self, window_state: WindowState):
-        GLib.idle_add(self._update_from_window_state, window_state)
+        # Only the newest state matters; coalesce event bursts into a single
+        # idle callback instead of queueing one refresh per event
+        self._pending_state = window_state
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            GLib.idle_add(self._flush_pending)
+
+    def _flush_pending(self) -> bool:
+        self._flush_scheduled = False
+        state, self._pending_state = self._pending_state, None
+        if state is not None:
+            self._update_from_window_state(state)
+        return False
 
     def _refresh_from_current_state(self):
-        current_state = self._window_detector.get_current_state()
-        GLib.idle_add(self._update_from_window_state, current_state)
+        self._on_window_state_changed(self._window_detector.get_current_state())
 
     def _update_from_window_state(self, window_state: WindowState):
+        # Most Hyprland events (focus changes etc.) don't alter anything we
+        # render; skip the whole refresh when the structural signature matches
+        state_sig = frozenset(
+            (group_key, group_data["app"].id, group_data["app"].is_pinned,
+             len(group_data["windows"]))
+            for group_key, group_data in window_state.app_groups.items()
+        )
+        if state_sig == self._last_state_sig:
+            return
+        self._last_state_sig = state_sig
+
         running_badges = self._badge_counter.get_running_apps_badges(
             window_state, exclude_pinned=True
         )
         active_app_ids = set()
+        structural_change = False
 
         for app_id, badge_info in running_badges.items():
             if badge_info.count <= 0:
                 continue
             active_app_ids.add(app_id)
-            icon_override = None
-            for group_key, group_data in window_state.app_groups.items():
-                if group_data["app"].id == app_id:
-                    icon_override = group_data["icon"]
-                    break
+            app_groups = window_state.app_groups_by_app_id.get(app_id)
+            icon_override = app_groups[0]["icon"] if app_groups else None
             if app_id in self._app_widgets:
                 widget = self._app_widgets[app_id]
                 widget.update_badge_info(badge_info)
@@ -228,8 +266,8 @@ class RunningApps(widgets.Box):
                     icon_override=icon_override
                 )
                 self.append(widget)
-                self._children.append(widget)
                 self._app_widgets[app_id] = widget
+                structural_change = True
 
         widgets_to_remove = [
             (app_id, widget) for app_id, widget in self._app_widgets.items()
@@ -240,20 +278,22 @@ class RunningApps(widgets.Box):
             try:
                 widget.cleanup()
                 self.remove(widget)
-                self._children.remove(widget)
                 del self._app_widgets[app_id]
+                structural_change = True
             except Exception:
                 pass
 
-        self.queue_draw()
+        # Label-only updates already invalidate their own child areas; a full
+        # container redraw is only needed when children were added or removed
+        if structural_change:
+            self.queue_draw()
 
     def cleanup(self):
-        for widget in self._children[:]:
+        for widget in list(self._app_widgets.values()):
             try:
                 widget.cleanup()
             except Exception:
                 pass
-        self._children.clear()
         self._app_widgets.clear()
         try:
             self._window_detector.unsubscribe(self._on_window_state_changed)
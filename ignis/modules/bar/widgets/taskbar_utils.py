@@ -1,5 +1,10 @@
+import os
+import socket
 import subprocess
 import logging
+import queue
+import threading
+from functools import partial
 from typing import List, Any, Optional, Callable
 from gi.repository import GLib
 from ignis.services.applications import Application
@@ -7,6 +12,94 @@ from ignis.menu_model import IgnisMenuModel, IgnisMenuItem, IgnisMenuSeparator
 
 logger = logging.getLogger("TaskbarUtils")
 
+# Hyprland command socket; talking to it directly skips the hyprctl
+# fork+exec entirely. Computed once at module load.
+_HYPR_SOCKET_PATH = None
+if os.environ.get("XDG_RUNTIME_DIR") and os.environ.get("HYPRLAND_INSTANCE_SIGNATURE"):
+    _HYPR_SOCKET_PATH = os.path.join(
+        os.environ["XDG_RUNTIME_DIR"],
+        "hypr",
+        os.environ["HYPRLAND_INSTANCE_SIGNATURE"],
+        ".socket.sock",
+    )
+
+
+def _send_dispatches(dispatches: List[str]) -> tuple:
+    """Send dispatch commands to Hyprland, preferring the IPC socket.
+
+    Returns (ok, detail) where detail is the socket response or stderr.
+    """
+    if _HYPR_SOCKET_PATH:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(_HYPR_SOCKET_PATH)
+                payload = "[[BATCH]]" + ";".join("/" + d for d in dispatches)
+                sock.sendall(payload.encode())
+                chunks = []
+                while True:
+                    data = sock.recv(4096)
+                    if not data:
+                        break
+                    chunks.append(data)
+            response = b"".join(chunks).decode("utf-8", "replace")
+            return "invalid" not in response.lower(), response
+        except OSError as e:
+            logger.debug(f"Hyprland socket dispatch failed, using hyprctl: {e}")
+
+    # Dispatch stdout is just "ok"; only stderr matters for diagnostics
+    result = subprocess.run(
+        ["hyprctl", "--batch", ";".join(dispatches)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    return result.returncode == 0, result.stderr or ""
+
+
+# Single long-lived worker so dispatches never block the GTK main loop
+_hypr_queue: queue.Queue = queue.Queue()
+
+def _hypr_worker():
+    while True:
+        dispatches, on_result = _hypr_queue.get()
+        try:
+            ok, detail = _send_dispatches(dispatches)
+            if on_result:
+                on_result(ok, detail)
+        except Exception as e:
+            logger.error(f"Error dispatching {dispatches}: {e}")
+        finally:
+            _hypr_queue.task_done()
+
+threading.Thread(target=_hypr_worker, daemon=True).start()
+
+def _dispatch_hyprctl(dispatches: List[str], on_result: Optional[Callable] = None):
+    """Queue dispatch commands for execution off the main thread"""
+    _hypr_queue.put((dispatches, on_result))
+
+# Menu activation handlers as free functions: partial() binds the argument
+# without allocating a fresh closure and cell per menu build. Activation
+# already runs on the GTK main thread, so the work is called directly
+# rather than bounced through an extra idle_add iteration.
+def _activate_launch(app, *_):
+    TaskbarUtils.launch_app(app)
+
+
+def _activate_callback(callback, *_):
+    callback()
+
+
+def _activate_toggle_pin(app, *_):
+    if app.is_pinned:
+        app.unpin()
+    else:
+        app.pin()
+
+
+def _activate_action(action, *_):
+    TaskbarUtils.launch_app_action(action)
+
+
 class TaskbarUtils:
     """Shared application launching utilities"""
     
@@ -44,31 +137,26 @@ class TaskbarUtils:
             logger.debug("No windows to focus")
             return
         
+        dispatches = []
         for window in windows:
-            try:
-                window_id = getattr(window, "id", None) or getattr(window, "address", None)
-                if window_id:
-                    # Focus the window
-                    result = subprocess.run(
-                        ["hyprctl", "dispatch", f"focuswindow address:{window_id}"], 
-                        capture_output=True, 
-                        text=True
-                    )
-                    if result.returncode == 0:
-                        logger.debug(f"Focused window {window_id}")
-                    else:
-                        logger.warning(f"Failed to focus window {window_id}: {result.stderr}")
-                    
-                    # Bring to top
-                    subprocess.run(
-                        ["hyprctl", "dispatch", f"alterzorder top,address:{window_id}"], 
-                        capture_output=True, 
-                        text=True
-                    )
-                else:
-                    logger.warning(f"Window has no ID or address: {window}")
-            except Exception as e:
-                logger.error(f"Error focusing window {window}: {e}")
+            window_id = getattr(window, "id", None) or getattr(window, "address", None)
+            if window_id:
+                dispatches.append(f"dispatch focuswindow address:{window_id}")
+                dispatches.append(f"dispatch alterzorder top,address:{window_id}")
+            else:
+                logger.warning(f"Window has no ID or address: {window}")
+
+        if not dispatches:
+            return
+
+        # A single batched write collapses 2N round-trips into one
+        def on_result(ok, detail):
+            if ok:
+                logger.debug(f"Focused {len(windows)} window(s)")
+            else:
+                logger.warning(f"Failed to focus windows: {detail}")
+
+        _dispatch_hyprctl(dispatches, on_result)
     
     @classmethod
     def close_windows(cls, windows: List[Any]):
@@ -77,23 +165,24 @@ class TaskbarUtils:
             logger.debug("No windows to close")
             return
         
+        dispatches = []
         for window in windows:
-            try:
-                window_id = getattr(window, "id", None) or getattr(window, "address", None)
-                if window_id:
-                    result = subprocess.run(
-                        ["hyprctl", "dispatch", f"closewindow address:{window_id}"],
-                        capture_output=True,
-                        text=True
-                    )
-                    if result.returncode == 0:
-                        logger.debug(f"Closed window {window_id}")
-                    else:
-                        logger.warning(f"Failed to close window {window_id}: {result.stderr}")
-                else:
-                    logger.warning(f"Window has no ID or address: {window}")
-            except Exception as e:
-                logger.error(f"Error closing window {window}: {e}")
+            window_id = getattr(window, "id", None) or getattr(window, "address", None)
+            if window_id:
+                dispatches.append(f"dispatch closewindow address:{window_id}")
+            else:
+                logger.warning(f"Window has no ID or address: {window}")
+
+        if not dispatches:
+            return
+
+        def on_result(ok, detail):
+            if ok:
+                logger.debug(f"Closed {len(dispatches)} window(s)")
+            else:
+                logger.warning(f"Failed to close windows: {detail}")
+
+        _dispatch_hyprctl(dispatches, on_result)
     
     @classmethod
     def focus_or_launch(cls, app: Application, windows: List[Any], terminal_format: str = None):
@@ -136,28 +225,21 @@ class TaskbarUtils:
             IgnisMenuModel ready to be used in a PopoverMenu
         """
         if on_focus_callback is None:
-            on_focus_callback = lambda: cls.focus_or_launch(app, windows)
-        
+            on_focus_callback = partial(cls.focus_or_launch, app, windows)
+
         if on_close_callback is None:
-            on_close_callback = lambda: cls.close_windows(windows)
-        
+            on_close_callback = partial(cls.close_windows, windows)
+
         menu_items = []
-        
+
         # Add Launch or Focus option
-        if window_count == 0:
-            # No windows open - always show Launch
-            menu_items.append(
-                IgnisMenuItem(
-                    label="Launch",
-                    on_activate=lambda x: GLib.idle_add(cls.launch_app, app)
-                )
-            )
-        elif show_launch:
-            # Windows exist but we want to show Launch anyway (pinned apps)
+        if window_count == 0 or show_launch:
+            # No windows open, or windows exist but Launch is wanted anyway
+            # (pinned apps)
             menu_items.append(
                 IgnisMenuItem(
                     label="Launch",
-                    on_activate=lambda x: GLib.idle_add(cls.launch_app, app)
+                    on_activate=partial(_activate_launch, app)
                 )
             )
         else:
@@ -165,48 +247,39 @@ class TaskbarUtils:
             menu_items.append(
                 IgnisMenuItem(
                     label="Focus All" if window_count > 1 else "Focus",
-                    on_activate=lambda x: GLib.idle_add(on_focus_callback)
+                    on_activate=partial(_activate_callback, on_focus_callback)
                 )
             )
-        
+
         menu_items.append(IgnisMenuSeparator())
-        
+
         # Add New Window only if windows exist
         if window_count > 0:
             menu_items.append(
                 IgnisMenuItem(
                     label="New Window",
-                    on_activate=lambda x: GLib.idle_add(cls.launch_app, app)
+                    on_activate=partial(_activate_launch, app)
                 )
             )
             menu_items.append(IgnisMenuSeparator())
-        
+
         # Add close option(s)
-        if window_count > 1:
-            menu_items.append(
-                IgnisMenuItem(
-                    label="Close All",
-                    on_activate=lambda x: GLib.idle_add(on_close_callback)
-                )
-            )
-        elif window_count == 1:
+        if window_count > 0:
             menu_items.append(
                 IgnisMenuItem(
-                    label="Close",
-                    on_activate=lambda x: GLib.idle_add(on_close_callback)
+                    label="Close All" if window_count > 1 else "Close",
+                    on_activate=partial(_activate_callback, on_close_callback)
                 )
             )
-        
+
         menu_items.append(IgnisMenuSeparator())
         menu_items.append(
             IgnisMenuItem(
                 label="Pin" if not app.is_pinned else "Unpin",
-                on_activate=lambda x: GLib.idle_add(
-                    app.unpin if app.is_pinned else app.pin
-                ),
+                on_activate=partial(_activate_toggle_pin, app),
             )
         )
-        
+
         # Add app actions if available
         if app.actions:
             menu_items.append(IgnisMenuSeparator())
@@ -214,8 +287,8 @@ class TaskbarUtils:
                 menu_items.append(
                     IgnisMenuItem(
                         label=action.name,
-                        on_activate=lambda x, action=action: GLib.idle_add(cls.launch_app_action, action),
+                        on_activate=partial(_activate_action, action),
                     )
                 )
-        
+
         return IgnisMenuModel(*menu_items)
\ No newline at end of file
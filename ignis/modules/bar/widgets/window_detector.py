@@ -1,68 +1,36 @@
-import os
-import socket
-import threading
+import time
 from typing import Callable, Set, Dict, List, Any
 from gi.repository import GLib
 from ignis.services.hyprland import HyprlandService
 from ignis.services.applications import ApplicationsService
 
+from .hypr_ipc import get_ipc
 from .window_matcher import WindowMatcher
 
 
 class WindowState:
     """Represents current window state data"""
+
+    __slots__ = ("windows", "app_groups", "app_groups_by_app_id", "last_update_time")
+
     def __init__(self):
-        self.windows: List[Any] = []
+        # Immutable snapshot; subscribers can share it without copying
+        self.windows: tuple = ()
         self.app_groups: Dict[str, Dict] = {}
+        # Reverse index: app id -> list of group_data dicts, so consumers
+        # don't have to scan every group to find one app's windows
+        self.app_groups_by_app_id: Dict[str, List[Dict]] = {}
         self.last_update_time: float = 0
 
-
-class HyprlandIPCListener:
-    """Hyprland IPC socket listener for window events"""
-    
-    def __init__(self, on_event_callback: Callable[[str, str], None]):
-        self._stop_event = threading.Event()
-        self._callback = on_event_callback
-        self._socket_path = self._get_socket_path()
-        self._thread = None
-
-    def _get_socket_path(self) -> str:
-        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
-        instance_sig = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
-        if not runtime_dir or not instance_sig:
-            raise RuntimeError("Missing required environment variables for Hyprland socket")
-        socket_path = os.path.join(runtime_dir, "hypr", instance_sig, ".socket2.sock")
-        return socket_path
-
-    def start(self):
-        if self._thread and self._thread.is_alive():
-            return
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._listener_thread, daemon=True)
-        self._thread.start()
-
-    def stop(self):
-        self._stop_event.set()
-        if self._thread:
-            self._thread.join()
-
-    def _listener_thread(self):
-        try:
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.connect(self._socket_path)
-        except Exception:
-            return
-
-        with sock:
-            file = sock.makefile("r")
-            while not self._stop_event.is_set():
-                line = file.readline()
-                if not line:
-                    break
-                line = line.strip()
-                if ">>" in line:
-                    event_type, event_data = line.split(">>", 1)
-                    self._callback(event_type, event_data)
+    def rebuild_app_index(self):
+        """Rebuild the app-id reverse index from app_groups"""
+        index: Dict[str, List[Dict]] = {}
+        for group_key, group_data in self.app_groups.items():
+            # Carry the key so index consumers can rebuild keyed dicts
+            # without rescanning app_groups
+            group_data["group_key"] = group_key
+            index.setdefault(group_data["app"].id, []).append(group_data)
+        self.app_groups_by_app_id = index
 
 
 class WindowDetector:
@@ -75,9 +43,12 @@ class WindowDetector:
         self.hyprland = HyprlandService.get_default()
         self.applications = ApplicationsService.get_default()
         self._subscribers: Set[Callable[[WindowState], None]] = set()
-        self._ipc_listener = None
+        # Immutable view rebuilt only on (un)subscribe; notify iterates it
+        # without copying the set per event
+        self._subs_tuple: tuple = ()
+        self._ipc_subscribed = False
         self._connected_windows: Set = set()
-        self._update_timeout_id = None
+        self._update_pending = False
         self._current_state = WindowState()
         
         # Connect to hyprland events
@@ -93,24 +64,33 @@ class WindowDetector:
     def subscribe(self, callback: Callable[[WindowState], None]):
         """Subscribe to window state changes"""
         self._subscribers.add(callback)
-        
-        # Send current state to new subscriber
-        callback(self._current_state)
-        
-        # Start IPC listener when first subscriber joins
-        if len(self._subscribers) == 1 and not self._ipc_listener:
-            self._ipc_listener = HyprlandIPCListener(self._on_ipc_event)
-            self._ipc_listener.start()
-    
+        self._subs_tuple = tuple(self._subscribers)
+
+        # Deliver the initial snapshot on the next main-loop tick so a heavy
+        # subscriber doesn't block whoever is registering it
+        GLib.idle_add(self._deliver_initial_state, callback)
+
+        # Join the shared IPC listener when first subscriber joins
+        if len(self._subscribers) == 1 and not self._ipc_subscribed:
+            get_ipc().subscribe("", self._on_ipc_event)
+            self._ipc_subscribed = True
+
     def unsubscribe(self, callback: Callable[[WindowState], None]):
         """Unsubscribe from window state changes"""
         self._subscribers.discard(callback)
-        
-        # Stop IPC listener when no subscribers left
-        if len(self._subscribers) == 0 and self._ipc_listener:
-            self._ipc_listener.stop()
-            self._ipc_listener = None
+        self._subs_tuple = tuple(self._subscribers)
+
+        # Leave the shared IPC listener when no subscribers left
+        if len(self._subscribers) == 0 and self._ipc_subscribed:
+            get_ipc().unsubscribe("", self._on_ipc_event)
+            self._ipc_subscribed = False
     
+    def _deliver_initial_state(self, callback: Callable[[WindowState], None]) -> bool:
+        """Send the current state to a freshly registered subscriber"""
+        if callback in self._subscribers:
+            callback(self._current_state)
+        return False
+
     def get_current_state(self) -> WindowState:
         """Get current window state (read-only)"""
         return self._current_state
@@ -126,47 +106,92 @@ class WindowDetector:
         self._connect_window_closed(window)
         self._schedule_state_update("window_added")
     
+    # Events that can change the grouping we track. Everything else —
+    # focus changes, workspace switches, monitor churn — used to trigger a
+    # full O(windows * apps) rescan for nothing.
+    _STRUCTURAL_EVENTS = frozenset({
+        "openwindow",
+        "windowtitle",
+        "windowtitlev2",
+        "movewindowv2",
+        "configreload",
+    })
+
     def _on_ipc_event(self, event_type: str, event_data: str):
         """Handle IPC events from Hyprland"""
-        self._schedule_state_update(f"ipc_{event_type}")
+        if event_type == "closewindow":
+            # A close only removes one window; patch the state in place
+            # instead of regrouping everything
+            GLib.idle_add(self._apply_close, event_data.strip())
+        elif event_type in self._STRUCTURAL_EVENTS:
+            self._schedule_state_update(f"ipc_{event_type}")
     
     def _on_window_changed(self, *args):
         """Handle generic window change event"""
         self._schedule_state_update("window_changed")
     
     def _schedule_state_update(self, trigger: str):
-        """Schedule state detection with debouncing"""
-        # Cancel any pending update
-        if self._update_timeout_id:
-            GLib.source_remove(self._update_timeout_id)
-        
-        # Schedule update with minimal delay for debouncing
-        self._update_timeout_id = GLib.timeout_add(30, self._detect_window_state_and_notify, trigger)
-    
-    def _detect_window_state_and_notify(self, trigger: str):
+        """Schedule state detection, coalescing event bursts"""
+        # A dirty flag plus one idle source collapses a whole burst of events
+        # into a single pass on the next main-loop iteration — no artificial
+        # delay and no source_remove/reschedule churn per event
+        if self._update_pending:
+            return
+        self._update_pending = True
+        GLib.idle_add(self._flush_state, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _flush_state(self):
         """Detect window state and notify subscribers"""
+        self._update_pending = False
         self._detect_window_state()
         self._notify_subscribers()
-        self._update_timeout_id = None
         return False
     
+    @staticmethod
+    def _window_address(window) -> str:
+        address = getattr(window, "address", None) or getattr(window, "id", "")
+        return str(address).removeprefix("0x")
+
+    def _apply_close(self, address: str) -> bool:
+        """Remove one closed window from the current state in place"""
+        addr = address.removeprefix("0x")
+        state = self._current_state
+        removed = False
+
+        for group_key, group_data in list(state.app_groups.items()):
+            kept = [w for w in group_data["windows"] if self._window_address(w) != addr]
+            if len(kept) != len(group_data["windows"]):
+                removed = True
+                if kept:
+                    group_data["windows"] = kept
+                else:
+                    del state.app_groups[group_key]
+
+        if removed:
+            state.windows = tuple(
+                w for w in state.windows if self._window_address(w) != addr
+            )
+            state.last_update_time = time.time()
+            state.rebuild_app_index()
+            self._notify_subscribers()
+        return False
+
     def _detect_window_state(self):
         """Detect and update current window state"""
-        import time
-        
         # Update window list
-        self._current_state.windows = list(self.hyprland.windows)
+        self._current_state.windows = tuple(self.hyprland.windows)
         self._current_state.last_update_time = time.time()
         
         # Group windows by application using the shared matcher
         self._current_state.app_groups = WindowMatcher.group_windows_by_app(
-            self._current_state.windows, 
+            self._current_state.windows,
             self.applications
         )
+        self._current_state.rebuild_app_index()
     
     def _notify_subscribers(self):
         """Notify all subscribers of state change"""
-        for callback in self._subscribers.copy():
+        for callback in self._subs_tuple:
             try:
                 callback(self._current_state)
             except Exception:
@@ -174,9 +199,11 @@ class WindowDetector:
     
     def cleanup(self):
         """Cleanup resources"""
-        if self._ipc_listener:
-            self._ipc_listener.stop()
+        if self._ipc_subscribed:
+            get_ipc().unsubscribe("", self._on_ipc_event)
+            self._ipc_subscribed = False
         self._subscribers.clear()
+        self._subs_tuple = ()
         self._connected_windows.clear()
 
 
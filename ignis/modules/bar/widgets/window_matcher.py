@@ -1,7 +1,41 @@
+import sys
+import weakref
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from ignis.services.applications import Application
 
 
+@dataclass(slots=True)
+class _NormWin:
+    """Normalized window attributes, computed once per window per pass"""
+    initial_title: str
+    current_title: str
+    class_name: str
+    app_id: str
+    window_class: str
+    initial_class: str
+
+# Normalized identifiers per Application, computed once per app instead of
+# re-lowercasing on every (window, app) comparison. Weak keys let entries
+# disappear with their Application objects.
+_APP_NORM_CACHE: "weakref.WeakKeyDictionary[Application, tuple]" = weakref.WeakKeyDictionary()
+
+# Sentinel distinguishing "not looked up yet" from a cached None
+_MISS = object()
+
+
+def _app_norm(app: Application) -> tuple:
+    """Return (id_lc, id_base_lc, name_lc) for an app, cached weakly"""
+    norm = _APP_NORM_CACHE.get(app)
+    if norm is None:
+        id_lc = sys.intern(app.id.lower()) if app.id else ""
+        id_base_lc = sys.intern(id_lc.replace(".desktop", "")) if id_lc else ""
+        name_lc = sys.intern(app.name.strip().lower()) if app.name else ""
+        norm = (id_lc, id_base_lc, name_lc)
+        _APP_NORM_CACHE[app] = norm
+    return norm
+
+
 class WindowMatcher:
     """Shared window matching logic for taskbar modules"""
     
@@ -14,7 +48,37 @@ class WindowMatcher:
     def normalize_app_id(app_id: str) -> str:
         """Normalize app ID for comparison - keeps full ID to distinguish webapps"""
         return WindowMatcher.normalize_string(app_id)
-    
+
+    # Attribute spellings differ between Hyprland bindings
+    # (initial_title vs initialTitle, class vs class_name); probed once on
+    # the first window seen so the hot path does single getattr calls
+    _title_attr = None
+    _class_attr = None
+
+    @classmethod
+    def _probe_attrs(cls, window: Any):
+        cls._title_attr = (
+            "initial_title" if hasattr(window, "initial_title") else "initialTitle"
+        )
+        cls._class_attr = "class" if hasattr(window, "class") else "class_name"
+
+    @classmethod
+    def _normalize_window(cls, window: Any) -> _NormWin:
+        """Build the normalized attribute bundle for a window in one pass"""
+        if cls._title_attr is None:
+            cls._probe_attrs(window)
+        norm = cls.normalize_string
+        class_name = getattr(window, "class_name", "")
+        window_class = getattr(window, cls._class_attr, "") or class_name
+        return _NormWin(
+            initial_title=norm(getattr(window, cls._title_attr, "")),
+            current_title=norm(getattr(window, "title", "")),
+            class_name=norm(class_name or getattr(window, "initial_class", "")),
+            app_id=norm(getattr(window, "app_id", "")),
+            window_class=norm(window_class),
+            initial_class=norm(getattr(window, "initial_class", "")),
+        )
+
     @classmethod
     def matches_window_to_app(cls, window: Any, app: Application) -> bool:
         """
@@ -23,44 +87,47 @@ class WindowMatcher:
         """
         if not window or not app:
             return False
-        
-        app_id_norm = cls.normalize_app_id(app.id)
-        app_name_norm = cls.normalize_string(app.name)
-        
-        # Get window properties
-        initial_title = cls.normalize_string(getattr(window, "initial_title", "") or getattr(window, "initialTitle", ""))
-        initial_class = cls.normalize_string(getattr(window, "initial_class", ""))
-        window_class = cls.normalize_string(getattr(window, "class", "") or getattr(window, "class_name", ""))
-        window_app_id = cls.normalize_string(getattr(window, "app_id", ""))
-        window_title = cls.normalize_string(getattr(window, "title", ""))
-        
+
+        # Accepts either a raw window or an already-normalized bundle so the
+        # grouping path doesn't re-normalize per (window, app) pair
+        nw = window if isinstance(window, _NormWin) else cls._normalize_window(window)
+
+        app_id_norm, _, app_name_norm = _app_norm(app)
+
+        # Fast reject: an app with no usable identifiers can't match anything
+        if not app_id_norm and not app_name_norm:
+            return False
+
         # Priority 1: Exact match by initial title with app name
-        if initial_title and app_name_norm and initial_title == app_name_norm:
+        if nw.initial_title and app_name_norm and nw.initial_title == app_name_norm:
             return True
-        
+
         # Priority 2: Exact match by app_id
-        if window_app_id and window_app_id == app_id_norm:
+        if nw.app_id and nw.app_id == app_id_norm:
             return True
-        
+
         # Priority 3: Exact match by initial_class
-        if initial_class and initial_class == app_id_norm:
+        if nw.initial_class and nw.initial_class == app_id_norm:
             return True
-        
+
         # Priority 4: Exact match by window class
-        if window_class and window_class == app_id_norm:
+        if nw.window_class and nw.window_class == app_id_norm:
             return True
-        
+
         # Priority 5: Substring match for app name in window title (fallback)
-        if window_title and app_name_norm and app_name_norm in window_title:
+        if nw.current_title and app_name_norm and app_name_norm in nw.current_title:
             return True
-        
-        # Priority 6: Partial match for app_id in class fields (for compatibility)
+
+        # Priority 6: Partial match for app_id in class fields (for
+        # compatibility). Length checks reject most pairs before the
+        # substring scan: a longer needle can never be contained.
         if app_id_norm:
-            if window_class and app_id_norm in window_class:
+            needle_len = len(app_id_norm)
+            if nw.window_class and needle_len <= len(nw.window_class) and app_id_norm in nw.window_class:
                 return True
-            if initial_class and app_id_norm in initial_class:
+            if nw.initial_class and needle_len <= len(nw.initial_class) and app_id_norm in nw.initial_class:
                 return True
-        
+
         return False
     
     @classmethod
@@ -69,30 +136,36 @@ class WindowMatcher:
         Group windows by their matching applications
         Returns dict with group_key -> {app, windows, icon}
         """
-        from .icon_manager import IconManager
-        
+        from .icon_manager import lookup_icon_override
+
         running_groups = {}
-        
+        # Per-pass memo: windows sharing a title (several terminals, browser
+        # profiles) hit a plain dict instead of the locked global LRU
+        local_icon_cache: Dict[str, Optional[str]] = {}
+
+        # One walk over the app list builds O(1) lookup tables for the whole
+        # pass instead of a linear scan per window
+        app_index = cls._build_app_index(applications_service)
+
         for window in windows:
-            # Get window identifiers
-            initial_title = cls.normalize_string(getattr(window, "initial_title", "") or getattr(window, "initialTitle", ""))
-            current_title = cls.normalize_string(getattr(window, "title", ""))
-            class_name = cls.normalize_string(getattr(window, "class_name", "") or getattr(window, "initial_class", ""))
-            
+            # Normalize every attribute once; all downstream helpers reuse it
+            nw = cls._normalize_window(window)
+            initial_title = nw.initial_title
+
             # Find matching application
-            app = cls._find_matching_app(window, applications_service)
+            app = cls._find_matching_app(nw, applications_service, app_index)
             if not app:
                 continue
-            
+
             # Create a smart group key that distinguishes different window types of the same app
-            group_key = cls._create_group_key(window, app, initial_title, current_title, class_name)
-            
+            group_key = cls._create_group_key(nw, app)
+
             # Get icon (try to find override from desktop file)
             icon_override = None
             if initial_title:
-                desktop_file = IconManager.find_desktop_file_by_name(initial_title)
-                if desktop_file:
-                    icon_override = IconManager.find_icon_for_desktop(desktop_file)
+                if (icon_override := local_icon_cache.get(initial_title, _MISS)) is _MISS:
+                    icon_override = lookup_icon_override(initial_title)
+                    local_icon_cache[initial_title] = icon_override
             
             # Use app icon if no override found
             if not icon_override:
@@ -115,14 +188,16 @@ class WindowMatcher:
         return running_groups
     
     @classmethod
-    def _create_group_key(cls, window: Any, app: Application, initial_title: str, current_title: str, class_name: str) -> str:
+    def _create_group_key(cls, nw: _NormWin, app: Application) -> str:
         """
         Create a group key that intelligently separates different window types
         without hardcoding specific patterns
         """
         # Strategy: Use the most specific identifier available
-        app_name_norm = cls.normalize_string(app.name)
-        
+        app_name_norm = _app_norm(app)[2]
+        initial_title = nw.initial_title
+        current_title = nw.current_title
+
         if initial_title:
             if initial_title != app_name_norm and initial_title not in app_name_norm and app_name_norm not in initial_title:
                 return f"{app.id}:{initial_title}"
@@ -143,76 +218,65 @@ class WindowMatcher:
         """
         if not window1 or not window2 or not app:
             return False
-        
-        # Get titles for both windows
-        title1_initial = cls.normalize_string(getattr(window1, "initial_title", "") or getattr(window1, "initialTitle", ""))
-        title1_current = cls.normalize_string(getattr(window1, "title", ""))
-        title2_initial = cls.normalize_string(getattr(window2, "initial_title", "") or getattr(window2, "initialTitle", ""))
-        title2_current = cls.normalize_string(getattr(window2, "title", ""))
-        
+
         # Create group keys for both windows
-        key1 = cls._create_group_key(window1, app, title1_initial, title1_current, "")
-        key2 = cls._create_group_key(window2, app, title2_initial, title2_current, "")
-        
+        key1 = cls._create_group_key(cls._normalize_window(window1), app)
+        key2 = cls._create_group_key(cls._normalize_window(window2), app)
+
         return key1 == key2
-    
+
     @classmethod
-    def _find_matching_app(cls, window: Any, applications_service) -> Optional[Application]:
-        """Find the application that matches a window"""
-        initial_title = getattr(window, "initial_title", "") or getattr(window, "initialTitle", "")
-        class_name = getattr(window, "class_name", "") or getattr(window, "initial_class", "")
-        
-        if initial_title:
-            app = cls._get_app_by_title(initial_title.strip(), applications_service)
+    def _build_app_index(cls, applications_service) -> tuple:
+        """Build (by_id, by_name, apps) lookup tables for one grouping pass"""
+        by_id: Dict[str, List[Application]] = {}
+        by_name: Dict[str, Application] = {}
+        apps = applications_service.apps
+        for app in apps:
+            id_lc, id_base, name_lc = _app_norm(app)
+            if id_lc:
+                by_id.setdefault(id_lc, []).append(app)
+                if id_base != id_lc:
+                    by_id.setdefault(id_base, []).append(app)
+            if name_lc and name_lc not in by_name:
+                by_name[name_lc] = app
+        return by_id, by_name, apps
+
+    @classmethod
+    def _find_matching_app(cls, nw: _NormWin, applications_service, app_index=None) -> Optional[Application]:
+        """Find the application that matches a normalized window"""
+        if app_index is None:
+            app_index = cls._build_app_index(applications_service)
+        by_id, by_name, apps = app_index
+
+        if nw.initial_title:
+            app = by_name.get(nw.initial_title)
             if app:
                 return app
-        
-        if class_name:
-            app = cls._get_app_by_class(class_name.strip(), applications_service)
+
+        if nw.class_name:
+            app = cls._get_app_by_class(nw.class_name, by_id, apps)
             if app:
                 return app
-        
+
         return None
-    
+
     @classmethod
-    def _get_app_by_class(cls, class_name: str, applications_service) -> Optional[Application]:
+    def _get_app_by_class(cls, class_name_lc: str, by_id: Dict[str, List[Application]], apps) -> Optional[Application]:
         """Find app by class name with smart matching priority"""
-        if not class_name:
+        if not class_name_lc:
             return None
-        
-        class_name_lc = class_name.lower()
-        
-        exact_matches = []
-        substring_matches = []
-        
-        for app in applications_service.apps:
-            app_id_lc = app.id.lower() if app.id else ""
-            if not app_id_lc:
-                continue
-                
-            app_id_base = app_id_lc.replace('.desktop', '')
-            if app_id_base == class_name_lc or app_id_lc == class_name_lc:
-                exact_matches.append(app)
-            elif class_name_lc in app_id_lc:
-                substring_matches.append(app)
-        
+
+        exact_matches = by_id.get(class_name_lc)
         if exact_matches:
             return min(exact_matches, key=lambda app: len(app.id))
-        
+
+        # Substring matches are rare; the linear scan only runs when the
+        # exact dict lookup misses
+        substring_matches = [
+            app for app in apps
+            if (app_id_lc := _app_norm(app)[0]) and class_name_lc in app_id_lc
+        ]
         if substring_matches:
             return min(substring_matches, key=lambda app: len(app.id))
-        
-        return None
-    
-    @classmethod
-    def _get_app_by_title(cls, title: str, applications_service) -> Optional[Application]:
-        """Find app by title"""
-        if not title:
-            return None
-        
-        title_lc = title.lower()
-        for app in applications_service.apps:
-            app_name_lc = app.name.lower() if app.name else ""
-            if app_name_lc and app_name_lc == title_lc:
-                return app
+
         return None
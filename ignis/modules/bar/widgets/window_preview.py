@@ -1,30 +1,238 @@
-import os
+import re
+import sys
 import logging
 import threading
 import time
+import weakref
 import subprocess
-import tempfile
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional
 
-from gi.repository import Gtk, GdkPixbuf, GLib, Gdk
+from gi.repository import Gtk, GLib, Gdk
 from ignis import widgets
 from ignis.services.hyprland import HyprlandService
 
+from .hypr_ipc import get_ipc
+
 logger = logging.getLogger(__name__)
 
+# grim -t ppm emits a trivial binary header followed by raw RGB pixels
+_PPM_HEADER = re.compile(rb"P6\n(\d+) (\d+)\n255\n")
+
+
+# Shared gray placeholder; textures are immutable so every widget can show
+# the same instance
+_fallback_texture: Optional[Gdk.Texture] = None
+
+
+def _get_fallback_texture() -> Gdk.Texture:
+    global _fallback_texture
+    if _fallback_texture is None:
+        width = WindowPreviewWidget.PREVIEW_WIDTH
+        height = WindowPreviewWidget.PREVIEW_HEIGHT
+        pixels = GLib.Bytes.new(b"\x40\x40\x40\xff" * (width * height))
+        _fallback_texture = Gdk.MemoryTexture.new(
+            width, height, Gdk.MemoryFormat.R8G8B8A8, pixels, width * 4
+        )
+    return _fallback_texture
+
+
+def _texture_from_ppm(data: bytes) -> Optional[Gdk.Texture]:
+    """Wrap a raw PPM frame in a texture without any image decoding"""
+    match = _PPM_HEADER.match(data)
+    if not match:
+        return None
+    width, height = int(match.group(1)), int(match.group(2))
+    pixels = GLib.Bytes.new(data[match.end():])
+    return Gdk.MemoryTexture.new(
+        width, height, Gdk.MemoryFormat.R8G8B8, pixels, width * 3
+    )
+
+
+class _CaptureScheduler:
+    """
+    Single daemon thread driving capture for every live preview widget.
+    One popover with nine previews used to mean nine threads and nine
+    concurrent grim processes; the scheduler serializes captures and
+    spreads them evenly across the refresh interval.
+    """
+
+    # Frames younger than one refresh interval are shared between widgets
+    # previewing the same window address instead of forking grim again
+    _FRAME_CACHE_MAX = 32
+
+    def __init__(self):
+        self._widgets: "weakref.WeakSet" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        # address -> (capture time, texture, frame hash); only touched from
+        # the capture thread, so no lock is needed
+        self._frames: "OrderedDict[str, tuple]" = OrderedDict()
+        self._ipc_subscribed = False
+
+    # Events that signal visible activity in a specific window; used to
+    # snap a backed-off preview straight back to full capture rate
+    _ACTIVITY_EVENTS = ("activewindowv2", "windowtitle", "windowtitlev2")
+
+    def register(self, widget):
+        with self._lock:
+            self._widgets.add(widget)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        if not self._ipc_subscribed:
+            self._ipc_subscribed = True
+            ipc = get_ipc()
+            for event_type in self._ACTIVITY_EVENTS:
+                ipc.subscribe(event_type, self._on_window_activity)
+        self._wake.set()
+
+    def _on_window_activity(self, event_type: str, event_data: str):
+        """Reset idle backoff for widgets previewing the active window"""
+        addr = event_data.split(",", 1)[0].strip().removeprefix("0x")
+        if not addr:
+            return
+        with self._lock:
+            widgets_ = list(self._widgets)
+        for widget in widgets_:
+            if widget._clean_address and widget._clean_address.removeprefix("0x") == addr:
+                widget._idle_ticks = 0
+                widget._next_due = 0.0
+
+    def unregister(self, widget):
+        with self._lock:
+            self._widgets.discard(widget)
+
+    # Back off while the window content is static: full rate for the first
+    # few identical frames, then 500 ms, then 2 s
+    _IDLE_STEPS = ((5, 0.1), (20, 0.5))
+    _IDLE_SLEEP_MAX = 2.0
+
+    @classmethod
+    def _idle_interval(cls, idle_ticks: int) -> float:
+        for limit, interval in cls._IDLE_STEPS:
+            if idle_ticks < limit:
+                return interval
+        return cls._IDLE_SLEEP_MAX
+
+    def _fresh_frame(self, address: Optional[str]) -> Optional[tuple]:
+        """Return a cached (texture, frame_hash) if recent enough, else None"""
+        if not address:
+            return None
+        cached = self._frames.get(address)
+        if cached is None:
+            return None
+        captured_at, texture, frame_hash = cached
+        if time.monotonic() - captured_at >= WindowPreviewWidget.REFRESH_INTERVAL_MS / 1000.0:
+            return None
+        return texture, frame_hash
+
+    def _store_frame(self, address: Optional[str], texture, frame_hash):
+        if not address:
+            return
+        self._frames[address] = (time.monotonic(), texture, frame_hash)
+        self._frames.move_to_end(address)
+        while len(self._frames) > self._FRAME_CACHE_MAX:
+            self._frames.popitem(last=False)
+
+    def _capture_one(self, widget):
+        try:
+            cached = self._fresh_frame(widget._clean_address)
+            if cached is not None:
+                texture, frame_hash = cached
+            else:
+                texture, frame_hash = widget._capture_window_thumbnail()
+                if texture:
+                    self._store_frame(widget._clean_address, texture, frame_hash)
+            if texture:
+                if frame_hash == widget._last_hash:
+                    # Unchanged frame: keep the texture we already show and
+                    # stretch this widget's next capture further out
+                    widget._idle_ticks += 1
+                else:
+                    widget._last_hash = frame_hash
+                    widget._idle_ticks = 0
+                    widget._last_texture = texture
+                    widget._post_texture(texture)
+                widget._next_due = time.monotonic() + self._idle_interval(widget._idle_ticks)
+            elif widget._last_texture is None and not widget._fallback_shown:
+                widget._fallback_shown = True
+                GLib.idle_add(widget._set_fallback_preview)
+        except Exception as e:
+            logger.debug(f"Preview update failed: {e}")
+
+    def _run(self):
+        while True:
+            with self._lock:
+                alive = [w for w in self._widgets if w._running]
+            if not alive:
+                # Park at zero CPU until the next widget registers
+                self._wake.clear()
+                self._wake.wait()
+                continue
+
+            targets = [w for w in alive if w._visible_event.is_set()]
+            if not targets:
+                # Widgets exist but their popovers are hidden; idle cheaply
+                time.sleep(0.25)
+                continue
+
+            # Round-robin: each widget refreshes once per interval, with
+            # captures spaced out so they never pile up concurrently.
+            # Slots are absolute monotonic deadlines, so a slow capture eats
+            # its own sleep instead of stretching the whole period.
+            spacing = (WindowPreviewWidget.REFRESH_INTERVAL_MS / 1000.0) / len(targets)
+            next_slot = time.monotonic()
+            for widget in targets:
+                if widget._running and time.monotonic() >= widget._next_due:
+                    self._capture_one(widget)
+                next_slot += spacing
+                slack = next_slot - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                else:
+                    # Overran the slot: drop the lost time and realign
+                    next_slot = time.monotonic()
+
+
+_capture_scheduler = _CaptureScheduler()
+
 
 class WindowPreviewWidget(widgets.Box):
     PREVIEW_WIDTH = 250
     PREVIEW_HEIGHT = 170
     REFRESH_INTERVAL_MS = 100  # throttle capture interval (ms)
 
-    def __init__(self, window: Any, on_click: Optional[Callable] = None):
+    # Cleared once if the installed grim rejects -t ppm; captures then fall
+    # back to PNG decoded straight to a texture
+    _ppm_supported = True
+
+    def __init__(self, window: Any, on_click: Optional[Callable] = None,
+                 visible_event: Optional[threading.Event] = None):
         super().__init__(orientation="vertical", spacing=4, css_classes=["window-preview"])
         self._window = window
         self._on_click = on_click
+        # Captures only run while this event is set; the owning popover
+        # shares one event across its widgets, standalone widgets are
+        # always considered visible
+        if visible_event is None:
+            visible_event = threading.Event()
+            visible_event.set()
+        self._visible_event = visible_event
+
+        # The address never changes; normalize it once instead of on every
+        # capture tick
+        address = getattr(window, "address", None)
+        self._clean_address = (
+            address if str(address).startswith("0x") else f"0x{address}"
+        ) if address else None
         self._preview_image = widgets.Picture()
         self._preview_image.set_size_request(self.PREVIEW_WIDTH, self.PREVIEW_HEIGHT)
         self._preview_image.css_classes = ["window-preview-image"]
+        # Full-size frames are handed over as-is; the GL renderer scales
+        # them down during paint, so no CPU resample pass is needed
+        self._preview_image.set_content_fit(Gtk.ContentFit.CONTAIN)
 
         window_title = getattr(window, "title", "") or "Untitled"
         self._title_label = widgets.Label(
@@ -37,83 +245,90 @@ class WindowPreviewWidget(widgets.Box):
         if on_click:
             self.on_click = lambda x: on_click(window)
 
-        self._last_pixbuf: Optional[GdkPixbuf.Pixbuf] = None
+        self._last_texture: Optional[Gdk.Texture] = None
+        self._last_hash: Optional[int] = None
+        self._idle_ticks = 0
+        self._next_due = 0.0
+        self._fallback_shown = False
         self._running = True
+        # Latest-frame slot: if the main loop lags, newer captures replace
+        # the pending one instead of queueing an idle source each
+        self._pending_texture: Optional[Gdk.Texture] = None
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
+
+        _capture_scheduler.register(self)
+
+    def _post_texture(self, texture):
+        with self._pending_lock:
+            self._pending_texture = texture
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        GLib.idle_add(self._drain_pending)
+
+    def _drain_pending(self) -> bool:
+        with self._pending_lock:
+            texture, self._pending_texture = self._pending_texture, None
+            self._drain_scheduled = False
+        if texture is not None:
+            self._update_texture(texture)
+        return False
 
-        self._thread = threading.Thread(target=self._update_loop, daemon=True)
-        self._thread.start()
-
-    def _update_loop(self):
-        while self._running:
-            try:
-                pixbuf = self._capture_window_thumbnail()
-                if pixbuf:
-                    self._last_pixbuf = pixbuf
-                    GLib.idle_add(self._update_texture, pixbuf)
-                elif self._last_pixbuf:
-                    # Reuse last successful capture
-                    GLib.idle_add(self._update_texture, self._last_pixbuf)
-                else:
-                    # Show fallback only once
-                    if not hasattr(self, '_fallback_shown'):
-                        GLib.idle_add(self._set_fallback_preview)
-                        self._fallback_shown = True
-            except Exception as e:
-                logger.debug(f"Preview update failed: {e}")
-            time.sleep(self.REFRESH_INTERVAL_MS / 1000.0)
-
-    def _update_texture(self, pixbuf):
+    def _update_texture(self, texture):
         try:
-            texture = Gdk.Texture.new_for_pixbuf(pixbuf)
             self._preview_image.paintable = texture
         except Exception as e:
             logger.debug(f"Failed to update texture: {e}")
 
-    def _capture_window_thumbnail(self) -> Optional[GdkPixbuf.Pixbuf]:
-        window_address = getattr(self._window, "address", None)
-        if not window_address:
-            return None
-
-        clean_address = window_address if str(window_address).startswith("0x") else f"0x{window_address}"
+    def _capture_window_thumbnail(self) -> tuple:
+        """Capture one frame; returns (texture, frame_hash) or (None, None)"""
+        clean_address = self._clean_address
+        if not clean_address:
+            return None, None
 
         try:
-            # Output to stdout using '-'
-            result = subprocess.run(
-                ["grim", "-w", clean_address, "-"],
-                capture_output=True,
-                timeout=2
-            )
+            # Raw PPM output to stdout: no PNG deflate in grim and no
+            # decode on our side, just a header parse and a pixel copy
+            if WindowPreviewWidget._ppm_supported:
+                result = subprocess.run(
+                    ["grim", "-t", "ppm", "-w", clean_address, "-"],
+                    capture_output=True,
+                    timeout=2
+                )
+                if result.returncode != 0 and b"ppm" in result.stderr.lower():
+                    WindowPreviewWidget._ppm_supported = False
+            if not WindowPreviewWidget._ppm_supported:
+                result = subprocess.run(
+                    ["grim", "-w", clean_address, "-"],
+                    capture_output=True,
+                    timeout=2
+                )
             if result.returncode == 0 and result.stdout:
-                loader = GdkPixbuf.PixbufLoader()
-                loader.write(result.stdout)
-                loader.close()
-                pixbuf = loader.get_pixbuf()
-                if pixbuf:
-                    # Optionally scale the pixbuf for preview
-                    return pixbuf.scale_simple(
-                        self.PREVIEW_WIDTH, self.PREVIEW_HEIGHT, GdkPixbuf.InterpType.BILINEAR
-                    )
+                raw = result.stdout
+                # Cheap change detector: sampling the edges is enough to
+                # tell consecutive frames apart without hashing megabytes
+                frame_hash = len(raw) ^ hash(raw[:64] + raw[-64:])
+                if WindowPreviewWidget._ppm_supported:
+                    return _texture_from_ppm(raw), frame_hash
+                # PNG decodes once, directly into a texture, with no
+                # PixbufLoader or pixbuf intermediate
+                return Gdk.Texture.new_from_bytes(GLib.Bytes.new(raw)), frame_hash
         except subprocess.TimeoutExpired:
             logger.debug(f"Screenshot capture timed out for {clean_address}")
         except Exception as e:
             logger.debug(f"Screenshot capture failed: {e}")
-        return None
+        return None, None
 
     def _set_fallback_preview(self):
         try:
-            surface = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, True, 8,
-                                           self.PREVIEW_WIDTH, self.PREVIEW_HEIGHT)
-            surface.fill(0x404040ff)
-            texture = Gdk.Texture.new_for_pixbuf(surface)
-            self._preview_image.paintable = texture
+            self._preview_image.paintable = _get_fallback_texture()
         except Exception as e:
             logger.debug(f"Failed to set fallback preview: {e}")
 
     def stop(self):
         self._running = False
-
-    def __del__(self):
-        self.stop()
+        _capture_scheduler.unregister(self)
 
 
 class WindowPreviewPopover(widgets.Window):
@@ -135,7 +350,12 @@ class WindowPreviewPopover(widgets.Window):
         self._app_name = app_name
         self._app_id = app_id
         self._preview_widgets: List[WindowPreviewWidget] = []
-        
+        # Dispatch arguments frozen per window at build time so clicks
+        # don't re-walk getattr chains
+        self._focus_args = {id(w): self._focus_arg(w) for w in windows}
+        # Shared with every preview widget; captures pause while cleared
+        self._visible_event = threading.Event()
+
         self._setup_content()
         self.set_size_request(self.PREVIEW_WIDTH, self.PREVIEW_HEIGHT)
         self.visible = False
@@ -166,34 +386,49 @@ class WindowPreviewPopover(widgets.Window):
     def _create_preview_grid(self) -> Optional[widgets.Widget]:
         try:
             if len(self._windows) == 1:
-                preview = WindowPreviewWidget(self._windows[0], self._on_window_clicked)
+                preview = WindowPreviewWidget(
+                    self._windows[0], self._on_window_clicked,
+                    visible_event=self._visible_event,
+                )
                 self._preview_widgets.append(preview)
                 return preview
 
-            container = widgets.Box(orientation="vertical", spacing=self.SPACING)
-            current_row = None
-            for i, window in enumerate(self._windows):
-                if i % self.MAX_COLUMNS == 0:
-                    current_row = widgets.Box(orientation="horizontal", spacing=self.SPACING)
-                    container.append(current_row)
-                preview = WindowPreviewWidget(window, self._on_window_clicked)
+            # FlowBox wraps children into rows in C; no manual row
+            # bookkeeping and a single parent for all previews
+            grid = Gtk.FlowBox(
+                max_children_per_line=self.MAX_COLUMNS,
+                min_children_per_line=min(len(self._windows), self.MAX_COLUMNS),
+                selection_mode=Gtk.SelectionMode.NONE,
+                homogeneous=True,
+                row_spacing=self.SPACING,
+                column_spacing=self.SPACING,
+            )
+            for window in self._windows:
+                preview = WindowPreviewWidget(
+                    window, self._on_window_clicked,
+                    visible_event=self._visible_event,
+                )
                 self._preview_widgets.append(preview)
-                current_row.append(preview)
-            return container
+                grid.append(preview)
+            return grid
         except Exception as e:
             logger.error(f"Failed to create preview grid: {e}")
             return None
 
+    @staticmethod
+    def _focus_arg(window: Any) -> Optional[str]:
+        """Precompute the focuswindow argument for a window"""
+        address = getattr(window, "address", None)
+        if address:
+            return f"address:{address}"
+        title = getattr(window, "title", "")
+        return f"title:{title}" if title else None
+
     def _on_window_clicked(self, window: Any):
         try:
-            hyprland = HyprlandService.get_default()
-            window_address = getattr(window, "address", None)
-            if window_address:
-                hyprland.dispatch("focuswindow", f"address:{window_address}")
-            else:
-                title = getattr(window, "title", "")
-                if title:
-                    hyprland.dispatch("focuswindow", f"title:{title}")
+            focus_arg = self._focus_args.get(id(window)) or self._focus_arg(window)
+            if focus_arg:
+                HyprlandService.get_default().dispatch("focuswindow", focus_arg)
             self.close()
         except Exception as e:
             logger.error(f"Failed to focus window: {e}")
@@ -202,6 +437,11 @@ class WindowPreviewPopover(widgets.Window):
     def show_at_position(self, x: int, y: int):
         self.set_margin_left(x)
         self.set_margin_top(y)
+        self._visible_event.set()
+        # Capture immediately on show regardless of earlier backoff
+        for widget in self._preview_widgets:
+            widget._next_due = 0.0
+            widget._idle_ticks = 0
         self.visible = True
 
     def hide_preview(self):
@@ -209,9 +449,10 @@ class WindowPreviewPopover(widgets.Window):
 
     def close(self):
         try:
+            self._visible_event.clear()
             for widget in self._preview_widgets:
                 widget.stop()
-            
+
             self.visible = False
             
             if hasattr(self, "destroy"):
@@ -220,115 +461,148 @@ class WindowPreviewPopover(widgets.Window):
             logger.debug(f"Error fully destroying popover: {e}")
 
 
+class _AppState:
+    """Popover and pending timeouts for one app, in a single dict slot"""
+
+    __slots__ = ("popover", "hover_tid", "hide_tid")
+
+    def __init__(self):
+        self.popover: Optional[WindowPreviewPopover] = None
+        self.hover_tid: Optional[int] = None
+        self.hide_tid: Optional[int] = None
+
+
 class WindowPreviewManager:
     HOVER_DELAY_MS = 800
     HIDE_DELAY_MS = 100
 
     def __init__(self):
-        self._active_popovers: Dict[str, WindowPreviewPopover] = {}
-        self._hover_timeouts: Dict[str, int] = {}
-        self._hide_timeouts: Dict[str, int] = {}
+        # One state object per app replaces three parallel dicts; hover
+        # events hash each app id once instead of three times
+        self._apps: Dict[str, _AppState] = {}
+        self._shutting_down = False
         self._hyprland = HyprlandService.get_default()
 
+    def _state(self, app_id: str) -> _AppState:
+        app_id = sys.intern(app_id)
+        state = self._apps.get(app_id)
+        if state is None:
+            state = self._apps[app_id] = _AppState()
+        return state
+
     def show_preview_for_app(self, widget, app_id, windows, app_name, position=None):
         if not windows:
             return
 
-        self._cancel_hide_timeout(app_id)
+        state = self._state(app_id)
+        self._cancel_hide_timeout(state)
 
-        if app_id in self._active_popovers:
-            prev = self._active_popovers[app_id]
+        if state.popover is not None:
             try:
-                prev.close()
+                state.popover.close()
             except Exception as e:
                 logger.debug(f"Error cleaning up previous popover: {e}")
-            del self._active_popovers[app_id]
+            state.popover = None
 
         try:
             preview_window = WindowPreviewPopover(windows, app_name, app_id)
-            self._active_popovers[app_id] = preview_window
+            state.popover = preview_window
             if position and isinstance(position, tuple) and len(position) == 2:
                 preview_window.show_at_position(position[0], position[1])
             else:
                 preview_window.show_at_position(100, 50)
         except Exception as e:
             logger.error(f"Failed to show preview for {app_name}: {e}")
-            if app_id in self._active_popovers:
-                del self._active_popovers[app_id]
+            state.popover = None
 
     def schedule_show_preview(self, widget, app_id, windows, app_name, position=None):
-        self._cancel_hover_timeout(app_id)
-        timeout_id = GLib.timeout_add(
+        state = self._state(app_id)
+        self._cancel_hover_timeout(state)
+        # Hold the hovered widget weakly for the delay window so a taskbar
+        # rebuild can free it before the timeout fires
+        wref = weakref.ref(widget)
+        state.hover_tid = GLib.timeout_add(
             self.HOVER_DELAY_MS,
-            lambda: self._show_preview_timeout(widget, app_id, windows, app_name, position)
+            lambda: self._show_preview_timeout(wref(), app_id, windows, app_name, position)
         )
-        self._hover_timeouts[app_id] = timeout_id
 
     def schedule_hide_preview(self, app_id):
-        if app_id in self._hover_timeouts:
+        state = self._state(app_id)
+        if state.hover_tid is not None:
             return
-        self._cancel_hide_timeout(app_id)
-        timeout_id = GLib.timeout_add(
+        self._cancel_hide_timeout(state)
+        state.hide_tid = GLib.timeout_add(
             self.HIDE_DELAY_MS,
             lambda: self._hide_preview_timeout(app_id)
         )
-        self._hide_timeouts[app_id] = timeout_id
 
     def cancel_scheduled_show(self, app_id):
-        self._cancel_hover_timeout(app_id)
+        state = self._apps.get(app_id)
+        if state:
+            self._cancel_hover_timeout(state)
 
     def cancel_scheduled_hide(self, app_id):
-        self._cancel_hide_timeout(app_id)
+        state = self._apps.get(app_id)
+        if state:
+            self._cancel_hide_timeout(state)
 
     def is_preview_visible(self, app_id: str) -> bool:
-        preview_window = self._active_popovers.get(app_id)
-        return preview_window is not None and preview_window.visible
+        state = self._apps.get(app_id)
+        return state is not None and state.popover is not None and state.popover.visible
 
     def _show_preview_timeout(self, widget, app_id, windows, app_name, position=None) -> bool:
-        if app_id in self._hover_timeouts:
-            del self._hover_timeouts[app_id]
+        if self._shutting_down:
+            return False
+        state = self._state(app_id)
+        state.hover_tid = None
+        if widget is None:
+            # Anchor widget was destroyed while the hover delay ran
+            return False
         self.show_preview_for_app(widget, app_id, windows, app_name, position)
         return False
 
     def hide_preview_for_app(self, app_id):
-        preview_window = self._active_popovers.get(app_id)
-        if preview_window:
+        state = self._apps.get(app_id)
+        if state and state.popover is not None:
             try:
-                preview_window.close()
+                state.popover.close()
             except Exception as e:
                 logger.debug(f"Error hiding preview: {e}")
-            del self._active_popovers[app_id]
+            state.popover = None
 
     def _hide_preview_timeout(self, app_id) -> bool:
-        if app_id in self._hide_timeouts:
-            del self._hide_timeouts[app_id]
+        if self._shutting_down:
+            return False
+        state = self._state(app_id)
+        state.hide_tid = None
         self.hide_preview_for_app(app_id)
         return False
 
-    def _cancel_hover_timeout(self, app_id):
-        if app_id in self._hover_timeouts:
-            GLib.source_remove(self._hover_timeouts[app_id])
-            del self._hover_timeouts[app_id]
+    @staticmethod
+    def _cancel_hover_timeout(state: _AppState):
+        if state.hover_tid is not None:
+            GLib.source_remove(state.hover_tid)
+            state.hover_tid = None
 
-    def _cancel_hide_timeout(self, app_id):
-        if app_id in self._hide_timeouts:
-            GLib.source_remove(self._hide_timeouts[app_id])
-            del self._hide_timeouts[app_id]
+    @staticmethod
+    def _cancel_hide_timeout(state: _AppState):
+        if state.hide_tid is not None:
+            GLib.source_remove(state.hide_tid)
+            state.hide_tid = None
 
     def cleanup(self):
-        for timeout_id in self._hover_timeouts.values():
-            GLib.source_remove(timeout_id)
-        for timeout_id in self._hide_timeouts.values():
-            GLib.source_remove(timeout_id)
-        self._hover_timeouts.clear()
-        self._hide_timeouts.clear()
-        
-        for preview_window in list(self._active_popovers.values()):
-            try:
-                preview_window.close()
-            except Exception as e:
-                logger.debug(f"Error closing preview window during cleanup: {e}")
-        self._active_popovers.clear()
+        # A flag checked in the timeout callbacks lets pending sources fire
+        # once and die on their own instead of walking every state for
+        # GLib.source_remove calls during shutdown
+        self._shutting_down = True
+        for state in self._apps.values():
+            if state.popover is not None:
+                try:
+                    state.popover.close()
+                except Exception as e:
+                    logger.debug(f"Error closing preview window during cleanup: {e}")
+                state.popover = None
+        self._apps.clear()
 
 
 _preview_manager: Optional[WindowPreviewManager] = None
@@ -1,4 +1,5 @@
 import os
+import re
 import asyncio
 import logging
 import ignis
@@ -6,16 +7,13 @@ from ignis import widgets
 from ignis.services.mpris import MprisService, MprisPlayer
 from ignis import utils
 from services.material import MaterialService
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader
 from ignis.css_manager import CssManager, CssInfoString
-import uuid
-import time
+import itertools
+from functools import lru_cache
+from collections import OrderedDict, defaultdict
+from weakref import WeakKeyDictionary
 
-# --- Logging setup ---
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 log = logging.getLogger("media-player")
 
 mpris = MprisService.get_default()
@@ -26,6 +24,41 @@ MEDIA_TEMPLATE = utils.get_current_dir() + "/media.scss"
 MEDIA_SCSS_CACHE_DIR = ignis.CACHE_DIR + "/media"
 os.makedirs(MEDIA_SCSS_CACHE_DIR, exist_ok=True)
 
+# Template parsed once at import; every reload used to re-read and
+# re-compile it per player per track change
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(os.path.dirname(MEDIA_TEMPLATE)), auto_reload=False
+)
+_MEDIA_TPL = _JINJA_ENV.get_template(os.path.basename(MEDIA_TEMPLATE))
+
+# Stand-in id used while compiling; swapped for the real per-player id
+# with a plain string replace so one compile serves every widget
+_CSS_ID_PLACEHOLDER = "__player_id__"
+
+
+def _css_passthrough(string: str) -> str:
+    """Compiler hook for CSS that was already sass-compiled"""
+    return string
+
+
+@lru_cache(maxsize=32)
+def _compiled_media_css(primary, on_primary, on_surface, on_surface_variant, art_url) -> str:
+    """Render and sass-compile the media stylesheet for one palette.
+
+    Class names carry a placeholder id, so the same artwork shown by any
+    player (or the same player across track-change notify storms) reuses
+    one libsass run instead of compiling per widget per change.
+    """
+    rendered = _MEDIA_TPL.render(
+        desktop_entry=_CSS_ID_PLACEHOLDER,
+        primary=primary,
+        onPrimary=on_primary,
+        onSurface=on_surface,
+        onSurfaceVariant=on_surface_variant,
+        art_url=art_url,
+    )
+    return utils.sass_compile(string=rendered)
+
 # Constants
 ARTWORK_POLL_INTERVAL = 2  # seconds
 NO_TRACK_GRACE_PERIOD = 8  # seconds
@@ -38,6 +71,18 @@ PLAYER_ICONS = {
     None: "folder-music-symbolic",
 }
 
+# Direct desktop-entry hits plus one compiled scan for the
+# chromium-family track ids
+_DESKTOP_ICON = {
+    "firefox": PLAYER_ICONS["firefox"],
+    "spotify": PLAYER_ICONS["spotify"],
+}
+_BROWSER_RE = re.compile(r"chrom(e|ium)|brave")
+
+# CSS ids only need to be distinct, not random; a counter avoids the
+# time()/uuid4() syscall + entropy draw per widget
+_player_id_seq = itertools.count()
+
 FALLBACK_COLORS = {
     "primary": "#333333",
     "onPrimary": "#D17500",
@@ -46,35 +91,95 @@ FALLBACK_COLORS = {
     "art_url": "",
 }
 
-LAST_ARTWORK_CACHE = {}
+# Most recent artwork per base track id, bounded so a long session
+# doesn't accumulate dead URIs forever
+LAST_ARTWORK_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_ARTWORK_CACHE_CAP = 128
+
+
+# Mirror of the CSS names this module has registered; membership tests
+# hit this set instead of rebuilding the manager's full name list, and
+# the per-entry index replaces prefix scans over all names
+_applied_css_names: set = set()
+_css_by_entry: "defaultdict[str, set]" = defaultdict(set)
+
+
+def _css_entry(name: str) -> str:
+    # Names are "<desktop_entry>-<seq>"
+    return name.rpartition("-")[0]
+
+
+def _register_css_name(name: str) -> None:
+    _applied_css_names.add(name)
+    _css_by_entry[_css_entry(name)].add(name)
+
+
+def _remove_css(name: str) -> None:
+    """Remove a stylesheet registered by this module, if present"""
+    if name in _applied_css_names:
+        try:
+            css_manager.remove_css(name)
+        except Exception as e:
+            log.error("Error removing CSS %s: %s", name, e)
+        _applied_css_names.discard(name)
+        _css_by_entry[_css_entry(name)].discard(name)
+
+
+def _remember_artwork(base_id: str, art_url: str) -> None:
+    LAST_ARTWORK_CACHE[base_id] = art_url
+    LAST_ARTWORK_CACHE.move_to_end(base_id)
+    while len(LAST_ARTWORK_CACHE) > _ARTWORK_CACHE_CAP:
+        LAST_ARTWORK_CACHE.popitem(last=False)
+
+
+@lru_cache(maxsize=64)
+def _cached_colors(path: str, mtime_ns: int) -> tuple:
+    """Memoized palette extraction keyed by file identity"""
+    colors = material.get_colors_from_img(path, True)
+    return tuple(sorted(colors.items()))
+
+
+def _extract_colors(path: str) -> dict:
+    """Extract colors for a file, reusing the result while it is unchanged.
+
+    Track restarts, seeks and notify storms re-deliver the same art file;
+    keying on (path, mtime) turns those repeats into a dict lookup.
+    Safe to call from a worker thread.
+    """
+    return dict(_cached_colors(path, os.stat(path).st_mtime_ns))
 
 class Player(widgets.Revealer):
     def __init__(self, player: MprisPlayer, media_container=None) -> None:
         self._player = player
         self._media_container = media_container
         self._polling_task = None
-        self._no_track_task = None
+        self._no_track_handle = None
         self._running = True
         self._destroyed = False
         
         # Create unique identifier for this player instance
         desktop_entry = player.desktop_entry or "unknown"
-        self._unique_id = f"{desktop_entry}-{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        self._unique_id = f"{desktop_entry}-{next(_player_id_seq)}"
         
-        log.info(f"Player initialized: desktop_entry={player.desktop_entry}, track_id={player.track_id}, unique_id={self._unique_id}")
+        log.info("Player initialized: desktop_entry=%s, track_id=%s, unique_id=%s", player.desktop_entry, player.track_id, self._unique_id)
+
+        # Set whenever art-url changes; lets poll_for_art sleep until the
+        # file can actually exist instead of stat()-ing on a timer
+        self._art_event = asyncio.Event()
+        # Serializes color reloads so overlapping notifications don't race
+        # on css_manager
+        self._colors_lock = asyncio.Lock()
+        # Pending debounced reload, if any
+        self._reload_handle = None
 
         player.connect("closed", lambda x: self.destroy())
-        player.connect("notify::art-url", lambda x, y: self.load_colors())
+        player.connect("notify::art-url", lambda x, y: self._on_art_url_changed())
         player.connect("notify::track-id", lambda x, y: asyncio.create_task(self._on_track_id_change_async()))
 
-        player.connect("notify::desktop-entry", lambda x, y: log.debug(f"desktop_entry changed: {x.desktop_entry}"))
-        player.connect("notify::title", lambda x, y: log.debug(f"title changed: {x.title}"))
-        player.connect("notify::artist", lambda x, y: log.debug(f"artist changed: {x.artist}"))
-
         self.load_colors()
 
         if not (self._player.art_url and os.path.isfile(self._player.art_url)):
-            log.debug(f"No initial artwork for {self._player.desktop_entry}, starting poller...")
+            log.debug("No initial artwork for %s, starting poller...", self._player.desktop_entry)
             self._polling_task = asyncio.create_task(self.poll_for_art())
 
         super().__init__(
@@ -160,30 +265,43 @@ class Player(widgets.Revealer):
             ),
         )
 
+    def _on_art_url_changed(self) -> None:
+        self._art_event.set()
+        self._schedule_reload()
+
+    def _schedule_reload(self, delay: float = 0.25) -> None:
+        """Debounce reloads: a notify burst does the expensive work once"""
+        if self._reload_handle is not None:
+            self._reload_handle.cancel()
+        self._reload_handle = asyncio.get_event_loop().call_later(delay, self._fire_reload)
+
+    def _fire_reload(self) -> None:
+        self._reload_handle = None
+        self.load_colors()
+
     async def poll_for_art(self):
+        # Event-driven: the notify::art-url handler wakes us up, so no
+        # periodic stat() loop runs while artwork is missing
         while self._running and not self._destroyed:
             try:
                 art_url = self._player.art_url
                 if art_url and os.path.isfile(art_url):
-                    log.info(f"Artwork found for {self._player.desktop_entry}: {art_url}")
+                    log.info("Artwork found for %s: %s", self._player.desktop_entry, art_url)
                     self.load_colors()
                     break
-                log.debug(f"Polling for artwork: {self._player.desktop_entry} (art_url={art_url})")
-                await asyncio.sleep(ARTWORK_POLL_INTERVAL)
+                self._art_event.clear()
+                await self._art_event.wait()
             except Exception as e:
-                log.error(f"Error in artwork polling: {e}")
+                log.error("Error in artwork polling: %s", e)
                 break
 
     def get_player_icon(self) -> str:
-        desktop_entry = self._player.desktop_entry
-        if desktop_entry == "firefox":
-            return PLAYER_ICONS["firefox"]
-        elif desktop_entry == "spotify":
-            return PLAYER_ICONS["spotify"]
-        elif self._player.track_id is not None:
-            track_id = str(self._player.track_id)
-            if "chromium" in track_id or "chrome" in track_id or "brave" in track_id:
-                return PLAYER_ICONS["chrome"]
+        icon = _DESKTOP_ICON.get(self._player.desktop_entry)
+        if icon:
+            return icon
+        track_id = self._player.track_id
+        if track_id is not None and _BROWSER_RE.search(str(track_id)):
+            return PLAYER_ICONS["chrome"]
         return PLAYER_ICONS[None]
 
     def destroy(self) -> None:
@@ -191,23 +309,23 @@ class Player(widgets.Revealer):
             return
         self._destroyed = True
 
-        log.info(f"Destroying player widget: {self._player.desktop_entry or 'unknown'} (unique_id: {self._unique_id})")
+        log.info("Destroying player widget: %s (unique_id: %s)", self._player.desktop_entry or 'unknown', self._unique_id)
         self._running = False
-        
+        # Unblock the artwork waiter so it can observe _destroyed and exit
+        self._art_event.set()
+
         # Cancel async tasks
+        if self._reload_handle is not None:
+            self._reload_handle.cancel()
+            self._reload_handle = None
         if self._polling_task:
             self._polling_task.cancel()
-        if self._no_track_task:
-            self._no_track_task.cancel()
-            self._no_track_task = None
+        if self._no_track_handle:
+            self._no_track_handle.cancel()
+            self._no_track_handle = None
         
         # Remove CSS for this specific instance
-        try:
-            if self._unique_id in css_manager.list_css_info_names():
-                css_manager.remove_css(self._unique_id)
-                log.debug(f"Removed CSS for {self._unique_id}")
-        except Exception as e:
-            log.error(f"Error removing CSS for {self._unique_id}: {e}")
+        _remove_css(self._unique_id)
         
         self.set_reveal_child(False)
         utils.Timeout(self.transition_duration, super().unparent)
@@ -217,118 +335,132 @@ class Player(widgets.Revealer):
         return f"{class_name}-{self._unique_id}"
 
     def _get_base_track_id(self) -> str:
-        tid = self._player.track_id or ""
-        if "/TrackList" in tid:
-            return tid.split("/TrackList")[0]
-        return tid
+        # partition stops at the first separator without building a list
+        return (self._player.track_id or "").partition("/TrackList")[0]
 
     async def _on_track_id_change_async(self):
         if self._destroyed:
             return
             
         tid = self._player.track_id or ""
-        log.debug(f"track_id changed observed: {tid}")
+        log.debug("track_id changed observed: %s", tid)
 
         if "NoTrack" in tid:
-            if self._no_track_task is None:
+            if self._no_track_handle is None:
                 log.info("Received NoTrack, starting grace timer before destroying widget.")
-                self._no_track_task = asyncio.create_task(self._no_track_timeout())
+                # call_later: no coroutine frame or Task object per
+                # NoTrack transition, and cancellation is a flag flip
+                self._no_track_handle = asyncio.get_event_loop().call_later(
+                    NO_TRACK_GRACE_PERIOD, self._on_no_track_fired
+                )
             return
 
         # Valid track came back; cancel any pending destruction
-        if self._no_track_task:
+        if self._no_track_handle:
             log.info("Valid track detected, cancelling no-track timeout.")
-            self._no_track_task.cancel()
-            self._no_track_task = None
+            self._no_track_handle.cancel()
+            self._no_track_handle = None
 
-        self.load_colors()
+        self._schedule_reload()
 
-    async def _no_track_timeout(self):
-        try:
-            await asyncio.sleep(NO_TRACK_GRACE_PERIOD)
-            if not self._destroyed:
-                log.info("No track prefix detected within timeout. Destroying widget.")
-                # Notify media container that this player should be marked as destroyed
-                if self._media_container:
-                    self._media_container._destroyed_players[self._player] = True
-                self.destroy()
-        except asyncio.CancelledError:
-            log.debug("NoTrack timeout cancelled")
+    def _on_no_track_fired(self) -> None:
+        self._no_track_handle = None
+        if self._destroyed:
+            return
+        log.info("No track prefix detected within timeout. Destroying widget.")
+        # Notify media container that this player should be marked as destroyed
+        if self._media_container:
+            self._media_container._destroyed_players[self._player] = True
+        self.destroy()
 
     async def safe_color_extraction(self, art_url: str) -> dict:
         """Safely extract colors from artwork with error handling."""
         try:
             if art_url and os.path.isfile(art_url):
-                colors = material.get_colors_from_img(art_url, True)
+                colors = _extract_colors(art_url)
                 colors["art_url"] = art_url
                 return colors
         except Exception as e:
-            log.error(f"Failed to extract colors from {art_url}: {e}")
+            log.error("Failed to extract colors from %s: %s", art_url, e)
         
         colors = FALLBACK_COLORS.copy()
         colors["art_url"] = ""
         return colors
 
     def load_colors(self) -> None:
+        """Schedule an async color reload; extraction runs off the loop"""
         if self._destroyed:
             return
-            
-        tid = self._player.track_id or ""
-        if "NoTrack" in tid:
-            return
+        asyncio.create_task(self._load_colors_async())
 
-        art_url = self._player.art_url
-        base_id = self._get_base_track_id()
-        log.debug(f"Loading colors for {self._player.desktop_entry}, base_track_id={base_id}, art_url={art_url}")
+    async def _load_colors_async(self) -> None:
+        async with self._colors_lock:
+            if self._destroyed:
+                return
 
-        if art_url and os.path.isfile(art_url):
-            log.info(f"Using artwork for {self._player.desktop_entry}: {art_url}")
-            colors = asyncio.create_task(self.safe_color_extraction(art_url))
-            colors = FALLBACK_COLORS.copy()  # Temporary fallback, should await the task
-            try:
-                colors = material.get_colors_from_img(art_url, True)
-                colors["art_url"] = art_url
-                LAST_ARTWORK_CACHE[base_id] = art_url
-            except Exception as e:
-                log.error(f"Error extracting colors: {e}")
-                colors = FALLBACK_COLORS.copy()
-                colors["art_url"] = ""
-        else:
-            cached = LAST_ARTWORK_CACHE.get(base_id)
-            if cached and os.path.isfile(cached):
-                log.info(f"Reusing cached artwork for {base_id}: {cached}")
+            tid = self._player.track_id or ""
+            if "NoTrack" in tid:
+                return
+
+            art_url = self._player.art_url
+            base_id = self._get_base_track_id()
+            log.debug("Loading colors for %s, base_track_id=%s, art_url=%s", self._player.desktop_entry, base_id, art_url)
+
+            if art_url and os.path.isfile(art_url):
+                log.info("Using artwork for %s: %s", self._player.desktop_entry, art_url)
                 try:
-                    colors = material.get_colors_from_img(cached, True)
-                    colors["art_url"] = cached
+                    # PIL decode + quantization off the event loop so UI
+                    # painting keeps going during track changes
+                    colors = await asyncio.to_thread(_extract_colors, art_url)
+                    colors["art_url"] = art_url
+                    _remember_artwork(base_id, art_url)
                 except Exception as e:
-                    log.error(f"Error using cached artwork: {e}")
+                    log.error("Error extracting colors: %s", e)
                     colors = FALLBACK_COLORS.copy()
                     colors["art_url"] = ""
             else:
-                log.warning(f"No artwork and no cached image for {self._player.desktop_entry}, using fallback colors.")
-                colors = FALLBACK_COLORS.copy()
-                colors["art_url"] = ""
+                cached = LAST_ARTWORK_CACHE.get(base_id)
+                if cached and os.path.isfile(cached):
+                    log.info("Reusing cached artwork for %s: %s", base_id, cached)
+                    try:
+                        colors = await asyncio.to_thread(_extract_colors, cached)
+                        colors["art_url"] = cached
+                    except Exception as e:
+                        log.error("Error using cached artwork: %s", e)
+                        colors = FALLBACK_COLORS.copy()
+                        colors["art_url"] = ""
+                else:
+                    log.warning("No artwork and no cached image for %s, using fallback colors.", self._player.desktop_entry)
+                    colors = FALLBACK_COLORS.copy()
+                    colors["art_url"] = ""
 
-        colors["desktop_entry"] = self._unique_id  # Use unique ID for CSS
+            try:
+                # Cache misses run libsass for tens of milliseconds; keep
+                # that off the event loop like the palette extraction
+                compiled = await asyncio.to_thread(
+                    _compiled_media_css,
+                    colors["primary"],
+                    colors["onPrimary"],
+                    colors["onSurface"],
+                    colors["onSurfaceVariant"],
+                    colors["art_url"],
+                )
+                css = compiled.replace(_CSS_ID_PLACEHOLDER, self._unique_id)
 
-        try:
-            with open(MEDIA_TEMPLATE) as file:
-                template_rendered = Template(file.read()).render(colors)
-
-            # Remove old CSS if it exists
-            if self._unique_id in css_manager.list_css_info_names():
-                css_manager.remove_css(self._unique_id)
-
-            # Apply new CSS with unique identifier
-            css_manager.apply_css(
-                CssInfoString(
-                    name=self._unique_id,
-                    compiler_function=lambda string: utils.sass_compile(string=string),
-                    string=template_rendered,
+                # Remove old CSS if it exists
+                _remove_css(self._unique_id)
+
+                # Already compiled above; register the plain CSS as-is
+                css_manager.apply_css(
+                    CssInfoString(
+                        name=self._unique_id,
+                        compiler_function=_css_passthrough,
+                        string=css,
+                    )
                 )
-            )
-        except Exception as e:
-            log.error(f"Error applying CSS: {e}")
+                _register_css_name(self._unique_id)
+            except Exception as e:
+                log.error("Error applying CSS: %s", e)
 
     def clean_desktop_entry(self) -> str:
         return self._player.desktop_entry or "unknown"
@@ -345,28 +477,25 @@ class Media(widgets.Box):
         )
 
         mpris.connect("notify::active-player", lambda x, y:
-            log.info(f"Active player changed: {x.active_player.desktop_entry if x.active_player else None}")
+            log.info("Active player changed: %s", x.active_player.desktop_entry if x.active_player else None)
         )
 
-        self._players = {}
-        self._destroyed_players = {}  # Track destroyed players by desktop_entry
+        # Weak keys: an MprisPlayer whose process is gone drops out of both
+        # maps instead of being pinned for the rest of the session
+        self._players: "WeakKeyDictionary[MprisPlayer, Player]" = WeakKeyDictionary()
+        self._destroyed_players: "WeakKeyDictionary[MprisPlayer, bool]" = WeakKeyDictionary()
 
     def __add_player(self, obj: MprisPlayer) -> None:
-        log.info(f"New player added: desktop_entry={obj.desktop_entry}, track_id={obj.track_id}")
+        log.info("New player added: desktop_entry=%s, track_id=%s", obj.desktop_entry, obj.track_id)
         
         # Clean up any existing CSS that might conflict
         desktop_entry = obj.desktop_entry or "unknown"
-        existing_css_names = [name for name in css_manager.list_css_info_names() if desktop_entry in name]
-        for name in existing_css_names:
-            try:
-                css_manager.remove_css(name)
-                log.debug(f"Cleaned up existing CSS: {name}")
-            except Exception as e:
-                log.error(f"Error cleaning up CSS {name}: {e}")
-        
+        for name in list(_css_by_entry.get(desktop_entry, ())):
+            _remove_css(name)
+
         # Check if this player was previously destroyed but is now active again
         if obj in self._destroyed_players:
-            log.info(f"Player {desktop_entry} was previously destroyed, removing from destroyed list")
+            log.info("Player %s was previously destroyed, removing from destroyed list", desktop_entry)
             del self._destroyed_players[obj]
         
         # Add track_id change monitoring to detect when media starts on existing players
@@ -384,17 +513,17 @@ class Media(widgets.Box):
         track_id = obj.track_id or ""
         desktop_entry = obj.desktop_entry or "unknown"
         
-        log.debug(f"Track change detected: desktop_entry={desktop_entry}, track_id={track_id}")
-        log.debug(f"Player in destroyed list: {obj in self._destroyed_players}")
-        log.debug(f"Player in active list: {obj in self._players}")
-        log.debug(f"Destroyed players count: {len(self._destroyed_players)}")
-        log.debug(f"Active players count: {len(self._players)}")
+        log.debug("Track change detected: desktop_entry=%s, track_id=%s", desktop_entry, track_id)
+        log.debug("Player in destroyed list: %s", obj in self._destroyed_players)
+        log.debug("Player in active list: %s", obj in self._players)
+        log.debug("Destroyed players count: %s", len(self._destroyed_players))
+        log.debug("Active players count: %s", len(self._players))
         
         # Check if this player needs a widget (either destroyed or never had one)
         needs_widget = (obj in self._destroyed_players) or (obj not in self._players)
         
         if needs_widget and track_id and "NoTrack" not in track_id:
-            log.info(f"Recreating widget for {desktop_entry} - media started on existing player")
+            log.info("Recreating widget for %s - media started on existing player", desktop_entry)
             
             # Remove from destroyed list if present
             if obj in self._destroyed_players:
@@ -408,21 +537,16 @@ class Media(widgets.Box):
                 del self._players[obj]
             
             # Clean up any conflicting CSS
-            existing_css_names = [name for name in css_manager.list_css_info_names() if desktop_entry in name]
-            for name in existing_css_names:
-                try:
-                    css_manager.remove_css(name)
-                    log.debug(f"Cleaned up existing CSS: {name}")
-                except Exception as e:
-                    log.error(f"Error cleaning up CSS {name}: {e}")
-            
+            for name in list(_css_by_entry.get(desktop_entry, ())):
+                _remove_css(name)
+
             # Create new player widget
             player = Player(obj, self)  # Pass self as media_container
             self._players[obj] = player
             self.append(player)
             player.set_reveal_child(True)
         else:
-            log.debug(f"No widget recreation needed. needs_widget={needs_widget}, track_id={track_id}")
+            log.debug("No widget recreation needed. needs_widget=%s, track_id=%s", needs_widget, track_id)
             if "NoTrack" in track_id:
                 log.debug("Track contains 'NoTrack', skipping recreation")
 
@@ -430,12 +554,12 @@ class Media(widgets.Box):
         player = self._players.pop(obj, None)
         if player:
             desktop_entry = obj.desktop_entry or "unknown"
-            log.info(f"Removing player widget for closed player {desktop_entry}")
+            log.info("Removing player widget for closed player %s", desktop_entry)
             
             # Mark this player as destroyed but don't remove the MPRIS object reference
             # The browser might still be running and could start playing media again
             self._destroyed_players[obj] = True
-            log.debug(f"Added {desktop_entry} to destroyed players list")
+            log.debug("Added %s to destroyed players list", desktop_entry)
             
             player.destroy()
             self.remove(player)
\ No newline at end of file
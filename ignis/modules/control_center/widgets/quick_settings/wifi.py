@@ -35,26 +35,27 @@ class WifiNetworkItem(widgets.Button):
 
 
 def deduplicate_access_points(access_points: list[WifiAccessPoint]) -> list[WifiAccessPoint]:
-    """Keep only the strongest signal for each SSID."""
-    seen_ssids = {}
-    
+    """Keep only the strongest signal for each SSID, strongest first."""
+    best = {}
     for ap in access_points:
-        if not ap.ssid:  # Skip empty SSIDs
+        ssid = ap.ssid
+        if not ssid:  # Skip empty SSIDs
             continue
-            
-        if ap.ssid not in seen_ssids:
-            seen_ssids[ap.ssid] = ap
-        else:
-            # Keep the one with stronger signal
-            if ap.strength > seen_ssids[ap.ssid].strength:
-                seen_ssids[ap.ssid] = ap
-    
-    # Sort by signal strength (strongest first)
-    return sorted(seen_ssids.values(), key=lambda ap: ap.strength, reverse=True)
+        current = best.get(ssid)
+        if current is None or ap.strength > current.strength:
+            best[ssid] = ap
+
+    result = list(best.values())
+    result.sort(key=lambda ap: ap.strength, reverse=True)
+    return result
 
 
 class WifiMenu(Menu):
     def __init__(self, device: WifiDevice):
+        # ssid -> (access point, row widget); rows are reused across scan
+        # ticks so only genuinely new networks allocate GTK widgets
+        self._ap_items: dict[str, tuple[WifiAccessPoint, WifiNetworkItem]] = {}
+        self._ap_box = widgets.Box(vertical=True)
         super().__init__(
             name="wifi",
             child=[
@@ -64,15 +65,7 @@ class WifiMenu(Menu):
                     on_change=lambda x, state: network.wifi.set_enabled(state),
                     css_classes=["network-header-box"],
                 ),
-                widgets.Box(
-                    vertical=True,
-                    child=device.bind(
-                        "access_points",
-                        transform=lambda value: [
-                            WifiNetworkItem(i) for i in deduplicate_access_points(value)
-                        ],
-                    ),
-                ),
+                self._ap_box,
                 widgets.Separator(),
                 widgets.Button(
                     css_classes=["network-item", "unset"],
@@ -91,6 +84,46 @@ class WifiMenu(Menu):
             ],
         )
 
+        # Pending debounced refresh, if any
+        self._refresh_handle = None
+        device.connect(
+            "notify::access-points",
+            lambda *args: self._schedule_refresh(device),
+        )
+        self._refresh_ap_list(device.access_points)
+
+    def _schedule_refresh(self, device: WifiDevice, delay: float = 0.5) -> None:
+        """Debounce refreshes: NM notifies per BSSID strength update,
+        far more often than the scan cadence the list actually needs"""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+        self._refresh_handle = asyncio.get_event_loop().call_later(
+            delay, lambda: self._fire_refresh(device)
+        )
+
+    def _fire_refresh(self, device: WifiDevice) -> None:
+        self._refresh_handle = None
+        self._refresh_ap_list(device.access_points)
+
+    def _refresh_ap_list(self, access_points: list[WifiAccessPoint]) -> None:
+        """Diff the scan result against existing rows instead of rebuilding"""
+        deduped = deduplicate_access_points(access_points)
+        items = self._ap_items
+
+        current_ssids = {ap.ssid for ap in deduped}
+        for ssid in list(items):
+            if ssid not in current_ssids:
+                del items[ssid]
+
+        for ap in deduped:
+            cached = items.get(ap.ssid)
+            # Recreate a row only when the SSID's strongest AP object
+            # changed; otherwise the existing widget is reused as-is
+            if cached is None or cached[0] is not ap:
+                items[ap.ssid] = (ap, WifiNetworkItem(ap))
+
+        self._ap_box.child = [items[ap.ssid][1] for ap in deduped]
+
 
 class WifiButton(QSButton):
     def __init__(self, device: WifiDevice):
@@ -1,7 +1,10 @@
 import re
 import asyncio
+import heapq
 import json
 import os
+import threading
+from operator import attrgetter
 from pathlib import Path
 from ignis import widgets
 from ignis.window_manager import WindowManager
@@ -23,31 +26,51 @@ MAX_SEARCH_RESULTS = 30
 window_manager = WindowManager.get_default()
 applications = ApplicationsService.get_default()
 
+# The desktop environment can't change mid-session; read it once
+_CURRENT_DE = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
+
+# Option values mirrored into a plain dict. Every LauncherAppItem reads
+# these during construction; a dict hit beats try/except plus property
+# access hundreds of times per launcher open
+_cached_cfg = {
+    "apps_per_row": 6,
+    "app_spacing": 8,
+    "show_labels": True,
+    "terminal_format": "kitty %command%",
+    "icon_size": 48,
+    "show_recent_apps": True,
+}
+
+
+def _init_cfg_cache() -> None:
+    for key in list(_cached_cfg):
+        try:
+            value = getattr(user_options.launcher, key)
+            if value is not None:
+                _cached_cfg[key] = value
+            user_options.launcher.bind(key, lambda v, k=key: _cached_cfg.__setitem__(k, v))
+        except Exception:
+            pass
+
+
+_init_cfg_cache()
+
 def get_apps_per_row():
-    try:
-        return user_options.launcher.apps_per_row
-    except Exception:
-        return 6
+    return _cached_cfg["apps_per_row"]
 
 def get_app_spacing():
-    try:
-        return user_options.launcher.app_spacing
-    except Exception:
-        return 8
+    return _cached_cfg["app_spacing"]
 
 def get_show_labels():
-    try:
-        return user_options.launcher.show_labels
-    except Exception:
-        return True
+    return _cached_cfg["show_labels"]
+
+def get_icon_size():
+    return _cached_cfg["icon_size"]
 
 def get_terminal_format():
-    try:
-        fmt = user_options.launcher.terminal_format
-        if fmt and "%command%" in fmt:
-            return fmt
-    except Exception:
-        pass
+    fmt = _cached_cfg["terminal_format"]
+    if fmt and "%command%" in fmt:
+        return fmt
     return "kitty %command%"
 
 CATEGORIES = {
@@ -64,6 +87,10 @@ CATEGORIES = {
     'Preferences': {'icon': 'preferences-system-symbolic', 'priority': 10},
 }
 
+# Flattened priority table; the category sort key becomes a bound dict
+# lookup instead of a get + index with a throwaway default dict
+_CAT_PRI = {k: v.get('priority', 999) for k, v in CATEGORIES.items()}
+
 RECENT_APPS_FILE = Path.home() / ".config" / "ignis" / "recent_apps.json"
 
 def load_recent_apps() -> List[Dict]:
@@ -81,31 +108,76 @@ def load_recent_apps() -> List[Dict]:
 def save_recent_apps(app_data: List[Dict]) -> None:
     try:
         RECENT_APPS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(RECENT_APPS_FILE, "w") as f:
+        # Write-then-rename keeps the file intact if we die mid-write
+        tmp_file = RECENT_APPS_FILE.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(app_data, f)
+        os.replace(tmp_file, RECENT_APPS_FILE)
     except (FileNotFoundError, PermissionError, json.JSONDecodeError) as e:
         print(f"Failed to save recent apps: {e}")
 
+
+_recent_flush_pending = False
+
+
+def _flush_recent_apps() -> bool:
+    global _recent_flush_pending
+    _recent_flush_pending = False
+    save_recent_apps(RECENT_APPS_DATA)
+    return False
+
+
+def _schedule_recent_save() -> None:
+    """Write the recent list on the next idle tick, off the click path"""
+    global _recent_flush_pending
+    if _recent_flush_pending:
+        return
+    _recent_flush_pending = True
+    GLib.idle_add(_flush_recent_apps)
+
 RECENT_APPS_DATA: List[Dict] = load_recent_apps()
 
+# id -> Application index; rebuilt lazily when the app list changes so
+# recent-app resolution is a dict hit instead of a list scan per entry
+_APP_INDEX: Dict[str, Application] = {}
+_APP_INDEX_SOURCE = None
+
+
+def _reset_app_index(*args) -> None:
+    global _APP_INDEX_SOURCE
+    _APP_INDEX.clear()
+    _APP_INDEX_SOURCE = None
+
+
+applications.connect("notify::apps", _reset_app_index)
+
+
 def get_app_by_id(app_id: str) -> Optional[Application]:
-    for app in applications.apps:
-        if getattr(app, "id", None) == app_id:
-            return app
-    return None
+    global _APP_INDEX_SOURCE
+    apps = applications.apps
+    source = (id(apps), len(apps))
+    if source != _APP_INDEX_SOURCE:
+        _APP_INDEX.clear()
+        for app in apps:
+            if getattr(app, "id", None):
+                _APP_INDEX[app.id] = app
+        _APP_INDEX_SOURCE = source
+    return _APP_INDEX.get(app_id)
 
 def get_recent_apps() -> List[Application]:
     result = []
-    sorted_data = sorted(RECENT_APPS_DATA, key=lambda x: (-x.get('count', 1), RECENT_APPS_DATA.index(x)))
+    # Enumerate once so the tiebreak is the stored position, not a
+    # quadratic list.index() per comparison
+    indexed = list(enumerate(RECENT_APPS_DATA))
+    indexed.sort(key=lambda t: (-t[1].get('count', 1), t[0]))
 
-    for app_data in sorted_data:
+    for _, app_data in indexed:
         app = get_app_by_id(app_data['id'])
         if app and AppCategorizer.should_show_app(app):
             result.append(app)
     return result
 
 def add_recent_app(app: Application):
-    global RECENT_APPS_DATA
     app_id = getattr(app, "id", None)
     if not app_id:
         return
@@ -118,31 +190,84 @@ def add_recent_app(app: Application):
     else:
         RECENT_APPS_DATA.insert(0, {"id": app_id, "count": 1})
 
-    RECENT_APPS_DATA = RECENT_APPS_DATA[:user_options.launcher.show_recent_apps and 10 or 0]
-    save_recent_apps(RECENT_APPS_DATA)
+    # Trim in place against the cached option; no new list, no property read
+    del RECENT_APPS_DATA[10 if _cached_cfg["show_recent_apps"] else 0:]
+    _schedule_recent_save()
 
 def clear_recent_apps():
     global RECENT_APPS_DATA
     RECENT_APPS_DATA = []
-    save_recent_apps(RECENT_APPS_DATA)
+    _schedule_recent_save()
 
 
 def is_url(url: str) -> bool:
-    regex = re.compile(
-        r'^(?:http|ftp)s?://'
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'
-        r'localhost|'
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}|'
-        r'\[?[A-F0-9]*:[A-F0-9:]+\]?)'
-        r'(?::\d+)?(?:/?|[/?]\S+)$',
-        re.IGNORECASE,
-    )
-    return re.match(regex, url) is not None
+    """Cheap "looks like a URL" test for launcher input.
+
+    The launcher only needs to tell a URL from a search query, so plain
+    string checks beat a big backtracking regex on per-keystroke input.
+    """
+    if url.startswith(('http://', 'https://', 'ftp://', 'ftps://')):
+        return True
+    return ' ' not in url and '.' in url and not url.endswith('.')
 
 
 class AppCategorizer:
     _desktop_cache = {}
 
+    # System dirs first so the user dir wins on duplicate ids
+    _APPLICATION_DIRS = (
+        "/usr/share/applications",
+        "/usr/local/share/applications",
+        os.path.expanduser("~/.local/share/applications"),
+    )
+
+    # desktop-file id -> (categories, executable) built by one directory
+    # walk, replacing up to three candidate-path opens per app
+    _prewarmed: Dict[str, Tuple[Set[str], Optional[str]]] = {}
+    _prewarm_ran = False
+    _prewarm_lock = threading.Lock()
+    _prewarm_done = threading.Event()
+
+    @classmethod
+    def _prewarm(cls) -> None:
+        """Read every .desktop file once and index categories/exec by id"""
+        with cls._prewarm_lock:
+            cls._prewarm_locked()
+        cls._prewarm_done.set()
+
+    @classmethod
+    def _prewarm_locked(cls) -> None:
+        if cls._prewarm_ran:
+            return
+        warmed: Dict[str, Tuple[Set[str], Optional[str]]] = {}
+        for directory in cls._APPLICATION_DIRS:
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith('.desktop'):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        text = Path(entry.path).read_text(encoding='utf-8', errors='ignore')
+                    except OSError:
+                        continue
+                    categories: Set[str] = set()
+                    executable = None
+                    for line in text.splitlines():
+                        if line.startswith('Categories='):
+                            cats = line[11:]
+                            categories.update(cat.strip() for cat in cats.split(';') if cat.strip())
+                        elif executable is None and line.startswith('Exec='):
+                            exec_line = line[5:]
+                            executable = exec_line.split()[0] if exec_line else None
+                    warmed[entry.name] = (categories, executable)
+        cls._prewarmed = warmed
+        cls._prewarm_ran = True
+
     SKIP_EXACT_NAMES = {
         'avahi-discover', 'bssh', 'bvnc', 'compton', 'dconf editor',
         'assistant', 'qdbusviewer', 'qt assistant', 'designer',
@@ -221,11 +346,20 @@ class AppCategorizer:
                         pass
                 except:
                     pass
-            desktop_paths = cls._get_desktop_paths(app)
-            for path in desktop_paths:
-                if cls._parse_desktop_file(path, categories, executable):
-                    if categories:
-                        break
+            if not categories and app_id:
+                desktop_id = app_id if app_id.endswith('.desktop') else f"{app_id}.desktop"
+                warmed = cls._prewarmed.get(desktop_id)
+                if warmed:
+                    categories.update(warmed[0])
+                    if not executable:
+                        executable = warmed[1]
+            if not categories:
+                # Prewarm missed this app; fall back to per-file parsing
+                desktop_paths = cls._get_desktop_paths(app)
+                for path in desktop_paths:
+                    if cls._parse_desktop_file(path, categories, executable):
+                        if categories:
+                            break
             if not categories and app_id:
                 try:
                     desktop_app = Gio.DesktopAppInfo.new(app_id)
@@ -264,24 +398,42 @@ class AppCategorizer:
     @classmethod
     def _parse_desktop_file(cls, path: str, categories: Set[str], executable: Optional[str]) -> bool:
         try:
-            expanded_path = os.path.expanduser(path)
-            if not os.path.exists(expanded_path):
-                return False
-            with open(expanded_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('Categories='):
-                        cats = line.split('=', 1)[1]
-                        categories.update(cat.strip() for cat in cats.split(';') if cat.strip())
-                    elif line.startswith('Exec=') and not executable:
-                        exec_line = line.split('=', 1)[1]
-                        executable = exec_line.split()[0] if exec_line else None
-            return True
-        except (FileNotFoundError, PermissionError, UnicodeDecodeError):
+            text = Path(os.path.expanduser(path)).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
             return False
+        # Single pass into a key -> value dict; first occurrence wins, so
+        # [Desktop Action] groups further down can't shadow the main entry
+        entries: Dict[str, str] = {}
+        for line in text.splitlines():
+            key, sep, value = line.partition('=')
+            if sep and key not in entries:
+                entries[key] = value
+        cats = entries.get('Categories')
+        if cats:
+            categories.update(cat.strip() for cat in cats.split(';') if cat.strip())
+        if not executable:
+            exec_line = entries.get('Exec')
+            if exec_line:
+                executable = exec_line.split()[0]
+        return True
+
+    # Visibility decisions are stable per app; cache them so repeated
+    # passes (recent apps + categorization) skip the attribute reads and
+    # pattern scans
+    _should_show_cache: Dict[str, bool] = {}
 
     @classmethod
     def should_show_app(cls, app: Application) -> bool:
+        cache_key = getattr(app, 'id', '') or app.name
+        cached = cls._should_show_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = cls._compute_should_show(app)
+        cls._should_show_cache[cache_key] = result
+        return result
+
+    @classmethod
+    def _compute_should_show(cls, app: Application) -> bool:
         try:
             if hasattr(app, 'app_info') and app.app_info:
                 try:
@@ -290,13 +442,11 @@ class AppCategorizer:
                     only_show_in = app.app_info.get_string('OnlyShowIn')
                     if only_show_in:
                         if 'kde' in only_show_in.lower() or 'xfce' in only_show_in.lower():
-                            current_de = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
-                            if current_de and 'gnome' in current_de:
+                            if _CURRENT_DE and 'gnome' in _CURRENT_DE:
                                 return False
                     not_show_in = app.app_info.get_string('NotShowIn')
                     if not_show_in and 'gnome' in not_show_in.lower():
-                        current_de = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
-                        if current_de and 'gnome' in current_de:
+                        if _CURRENT_DE and 'gnome' in _CURRENT_DE:
                             return False
                 except:
                     pass
@@ -304,9 +454,8 @@ class AppCategorizer:
             app_id_lower = getattr(app, 'id', '').lower()
             if app_name_lower in cls.SKIP_EXACT_NAMES:
                 return False
-            for pattern in cls.SKIP_PATTERNS:
-                if pattern in app_name_lower or pattern in app_id_lower:
-                    return False
+            if _SKIP_RE.search(app_name_lower) or _SKIP_RE.search(app_id_lower):
+                return False
             if 'service' in app_name_lower and any(word in app_name_lower for word in ['background', 'daemon', 'helper']):
                 return False
             return True
@@ -322,25 +471,44 @@ class AppCategorizer:
         app_name_lower = app.name.lower()
         app_id_lower = getattr(app, 'id', '').lower()
         executable_lower = (executable or '').lower()
-        for category, keywords in cls.CATEGORY_KEYWORDS.items():
-            if any(name in app_name_lower or name in executable_lower for name in keywords['names']):
+        for category in cls.CATEGORY_KEYWORDS:
+            name_re = _CAT_NAME_RES[category]
+            if name_re and (name_re.search(app_name_lower) or name_re.search(executable_lower)):
                 return category
-            if any(cat in categories_lower for cat in keywords['categories']):
+            if not _CAT_TOKEN_SETS[category].isdisjoint(categories_lower):
                 return category
         return 'Utilities'
 
 
+# One alternation scans each string once instead of a substring pass per
+# skip pattern
+_SKIP_RE = re.compile('|'.join(re.escape(p) for p in AppCategorizer.SKIP_PATTERNS))
+
+# Per-category matchers built once: a compiled name alternation and a
+# frozenset of desktop-file tokens replace the nested any() loops that
+# ran per app during population
+_CAT_NAME_RES: Dict[str, Optional["re.Pattern"]] = {}
+_CAT_TOKEN_SETS: Dict[str, frozenset] = {}
+for _category, _keywords in AppCategorizer.CATEGORY_KEYWORDS.items():
+    _CAT_NAME_RES[_category] = (
+        re.compile('|'.join(re.escape(n) for n in _keywords['names']))
+        if _keywords['names'] else None
+    )
+    _CAT_TOKEN_SETS[_category] = frozenset(_keywords['categories'])
+
+
 class LauncherAppItem(widgets.Button):
     def __init__(self, application: Application) -> None:
-        self._menu = widgets.PopoverMenu()
+        # Built on first right-click; most tiles never open their menu
+        self._menu = None
         self._application = application
 
-        icon_size = user_options.launcher.icon_size if hasattr(user_options.launcher, 'icon_size') else 48
+        icon_size = get_icon_size()
         icon_name = application.icon or "application-x-executable"
 
         label_visible = get_show_labels()
 
-        label_widget = widgets.Label(
+        self._label = widgets.Label(
             label=application.name,
             ellipsize="END",
             max_width_chars=20,
@@ -350,29 +518,51 @@ class LauncherAppItem(widgets.Button):
             css_classes=["launcher-app-label"],
         ) if label_visible else None
 
-        children_widgets = [
-            widgets.Icon(image=icon_name, pixel_size=icon_size),
-        ]
+        self._icon = widgets.Icon(image=icon_name, pixel_size=icon_size)
+        children_widgets = [self._icon]
 
-        if label_widget:
-            children_widgets.append(label_widget)
+        if self._label:
+            children_widgets.append(self._label)
 
-        children_widgets.append(self._menu)
+        self._content_box = widgets.Box(
+            vertical=True,
+            spacing=get_app_spacing(),
+            child=children_widgets,
+        )
 
         super().__init__(
             on_click=lambda w: self.launch(),
-            on_right_click=lambda w: self._menu.popup(),
+            on_right_click=lambda w: self._popup_menu(),
             css_classes=["launcher-app"],
-            child=widgets.Box(
-                vertical=True,
-                spacing=get_app_spacing(),
-                child=children_widgets,
-            ),
+            child=self._content_box,
             hexpand=True,
             vexpand=False,
         )
-        self._sync_menu()
-        application.connect("notify::is-pinned", lambda w, p: self._sync_menu())
+
+    def _popup_menu(self) -> None:
+        if self._menu is None:
+            self._menu = widgets.PopoverMenu()
+            self._content_box.append(self._menu)
+            self._sync_menu()
+            self._pin_handler = self._application.connect(
+                "notify::is-pinned", lambda w, p: self._sync_menu()
+            )
+        self._menu.popup()
+
+    def set_app(self, application: Application) -> None:
+        """Point a pooled tile at a different application in place"""
+        if application is self._application:
+            return
+        if self._menu is not None:
+            # The menu model and pin subscription belong to the old app;
+            # drop them and let the next right-click rebuild lazily
+            self._application.disconnect(self._pin_handler)
+            self._content_box.remove(self._menu)
+            self._menu = None
+        self._application = application
+        self._icon.image = application.icon or "application-x-executable"
+        if self._label is not None:
+            self._label.label = application.name
 
     def launch(self) -> None:
         terminal_fmt = get_terminal_format()
@@ -415,21 +605,32 @@ class LauncherAppItem(widgets.Button):
         self._menu.model = IgnisMenuModel(*menu_items)
 
 
-class SearchWebButton(widgets.Button):
-    def __init__(self, query: str):
-        self._url = ""
+# Default-browser icon, resolved once; xdg-settings forks a process and
+# the answer doesn't change within a session
+_browser_icon = None
+
 
+def _get_browser_icon() -> str:
+    global _browser_icon
+    if _browser_icon is None:
+        icon_name = "applications-internet-symbolic"
         try:
             browser_desktop_file = utils.exec_sh("xdg-settings get default-web-browser").stdout.strip()
             app_info = Gio.DesktopAppInfo.new(desktop_id=browser_desktop_file)
-            icon_name = "applications-internet-symbolic"
-
             if app_info:
                 icon_string = app_info.get_string("Icon")
                 if icon_string:
                     icon_name = icon_string
         except:
-            icon_name = "applications-internet-symbolic"
+            pass
+        _browser_icon = icon_name
+    return _browser_icon
+
+
+class SearchWebButton(widgets.Button):
+    def __init__(self, query: str):
+        self._url = ""
+        icon_name = _get_browser_icon()
 
         if not query.startswith(("http://", "https://")) and "." in query:
             query = "https://" + query
@@ -448,7 +649,7 @@ class SearchWebButton(widgets.Button):
                 vertical=True,
                 spacing=get_app_spacing(),
                 child=[
-                    widgets.Icon(image=icon_name, pixel_size=user_options.launcher.icon_size),
+                    widgets.Icon(image=icon_name, pixel_size=get_icon_size()),
                     widgets.Label(label=label, css_classes=["launcher-app-label"]) if get_show_labels() else None,
                 ]
             ),
@@ -578,6 +779,10 @@ class CategorizedAppsPage(widgets.Box):
         self._current_category = None
         self._category_buttons = {}
         self._app_items = []  # Track for keyboard navigation
+        # Built pages and their item lists, keyed by category; a switch back
+        # to a visited category reuses the widgets instead of rebuilding
+        self._category_pages: Dict[str, Gtk.ScrolledWindow] = {}
+        self._category_items: Dict[str, List["LauncherAppItem"]] = {}
 
         self._create_ui()
 
@@ -609,7 +814,7 @@ class CategorizedAppsPage(widgets.Box):
     def _create_category_buttons(self) -> None:
         sorted_categories = sorted(
             self._categorized_apps.keys(),
-            key=lambda cat: CATEGORIES.get(cat, {'priority': 999})['priority']
+            key=_CAT_PRI.__getitem__
         )
         for category in sorted_categories:
             app_count = len(self._categorized_apps[category])
@@ -621,10 +826,19 @@ class CategorizedAppsPage(widgets.Box):
         if category not in self._categorized_apps:
             return
         self._current_category = category
-        apps = self._categorized_apps[category]
         for cat, button in self._category_buttons.items():
             button.set_active(cat == category)
 
+        page = self._category_pages.get(category)
+        if page is None:
+            page = self._build_category_page(category)
+            self._category_pages[category] = page
+        self._app_items = self._category_items[category]
+        self._apps_display_area.child = [page]
+
+    def _build_category_page(self, category: str) -> Gtk.ScrolledWindow:
+        apps = self._categorized_apps[category]
+
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_hexpand(True)
@@ -640,21 +854,53 @@ class CategorizedAppsPage(widgets.Box):
         grid.set_margin_top(16)
         grid.set_margin_bottom(16)
 
-        self._app_items = []
+        items: List[LauncherAppItem] = []
+        self._category_items[category] = items
 
-        apps_per_row = user_options.launcher.apps_per_row if hasattr(user_options.launcher, 'apps_per_row') else 6
+        apps_per_row = get_apps_per_row()
 
-        for index, app in enumerate(apps):
-            row = index // apps_per_row
-            column = index % apps_per_row
-            app_item = LauncherAppItem(app)
-            if self._first_app_item is None:
-                self._first_app_item = app_item
-            self._app_items.append(app_item)
-            grid.attach(app_item, column, row, 1, 1)
+        # Build only the rows visible without scrolling synchronously; the
+        # rest arrive in idle batches so a big category doesn't stall the
+        # frame that switches to it. The idle source captures its own state,
+        # so a hidden (cached) page keeps filling in the background.
+        eager = min(len(apps), apps_per_row * self._EAGER_ROWS)
+        for index in range(eager):
+            self._attach_app(grid, apps[index], index, apps_per_row, items)
+
+        if eager < len(apps):
+            state = {"next": eager}
+
+            def fill_batch() -> bool:
+                end = min(state["next"] + apps_per_row * self._EAGER_ROWS, len(apps))
+                for index in range(state["next"], end):
+                    self._attach_app(grid, apps[index], index, apps_per_row, items)
+                state["next"] = end
+                return end < len(apps)
+
+            GLib.idle_add(fill_batch)
 
         scrolled.set_child(grid)
-        self._apps_display_area.child = [scrolled]
+        return scrolled
+
+    # Rows attached synchronously on a category switch; roughly one
+    # viewport's worth at the default icon size
+    _EAGER_ROWS = 4
+
+    def _attach_app(
+        self,
+        grid,
+        app: Application,
+        index: int,
+        apps_per_row: int,
+        items: List["LauncherAppItem"],
+    ) -> None:
+        row = index // apps_per_row
+        column = index % apps_per_row
+        app_item = LauncherAppItem(app)
+        if self._first_app_item is None:
+            self._first_app_item = app_item
+        items.append(app_item)
+        grid.attach(app_item, column, row, 1, 1)
 
     def get_first_app(self) -> Optional[LauncherAppItem]:
         return self._first_app_item
@@ -665,6 +911,10 @@ class CategorizedAppsPage(widgets.Box):
 
 class Launcher(widgets.Window):
     def __init__(self):
+        # Warm the .desktop metadata cache off the main thread so window
+        # construction never pays the disk walk
+        threading.Thread(target=AppCategorizer._prewarm, daemon=True).start()
+
         self._apps_container = widgets.Box(
             vertical=True,
             visible=True,
@@ -677,6 +927,21 @@ class Launcher(widgets.Window):
         self._current_page_index = 0
         self._current_search_results = []
         self._search_timeout = None
+        self._pending_rebuild = False
+
+        # Parallel lowercase columns snapshotted per app-list change, so a
+        # search doesn't re-lowercase every name and id per keystroke
+        self._search_names: List[str] = []
+        self._search_ids: List[str] = []
+        self._search_apps: List[Application] = []
+        self._search_masks: List[int] = []
+        self._build_search_index()
+        applications.connect("notify::apps", self._build_search_index)
+
+        # Categorization is independent of user options; option-driven
+        # rebuilds reuse this until the app list itself changes
+        self._categorize_cache = None
+        applications.connect("notify::apps", self._invalidate_categorize_cache)
 
         self._entry = widgets.Entry(
             hexpand=True,
@@ -695,6 +960,26 @@ class Launcher(widgets.Window):
         self._scrolled_window.set_child(self._apps_container)
         self._scrolled_window.add_css_class("launcher-content")
 
+        # Persistent search-results surface: tiles are pooled and pointed at
+        # new apps per query instead of being rebuilt every keystroke
+        self._search_grid = Gtk.Grid()
+        self._search_grid.set_hexpand(True)
+        self._search_grid.set_margin_start(16)
+        self._search_grid.set_margin_end(16)
+        self._search_grid.set_margin_top(16)
+        self._search_grid.set_margin_bottom(16)
+        self._search_scrolled = Gtk.ScrolledWindow()
+        self._search_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self._search_scrolled.set_hexpand(True)
+        self._search_scrolled.set_vexpand(True)
+        self._search_scrolled.set_child(self._search_grid)
+        self._search_pool: List[LauncherAppItem] = []
+        self._search_pool_per_row = get_apps_per_row()
+
+        # Built CategorizedAppsPage widgets per page index; reused until the
+        # data or a layout option changes
+        self._page_widgets: Dict[int, CategorizedAppsPage] = {}
+
         main_box = widgets.Box(
             vertical=True,
             valign="start",
@@ -760,6 +1045,31 @@ class Launcher(widgets.Window):
         user_options.launcher.bind("show_labels", self._on_option_change)
         user_options.launcher.bind("terminal_format", self._on_option_change)
 
+    def _build_search_index(self, *args) -> None:
+        """Snapshot lowercase (name, id) columns for the search loop"""
+        names: List[str] = []
+        ids: List[str] = []
+        apps: List[Application] = []
+        masks: List[int] = []
+        for app in applications.apps:
+            name = app.name.lower()
+            app_id = getattr(app, "id", "").lower()
+            # 64-bit character-presence signature over name + id; a query
+            # whose characters aren't all present can't be a substring
+            mask = 0
+            for c in name:
+                mask |= 1 << (ord(c) & 63)
+            for c in app_id:
+                mask |= 1 << (ord(c) & 63)
+            names.append(name)
+            ids.append(app_id)
+            apps.append(app)
+            masks.append(mask)
+        self._search_names = names
+        self._search_ids = ids
+        self._search_apps = apps
+        self._search_masks = masks
+
     def _perform_search(self):
         query = self._entry.text.strip().lower()
         if not query:
@@ -767,23 +1077,45 @@ class Launcher(widgets.Window):
             self._show_all_apps_page(self._current_page_index)
         else:
             results = []
-            for app in applications.apps:
-                # Match against name, id, or other metadata
-                if query in app.name.lower() or query in getattr(app, "id", "").lower():
-                    results.append(app)
-            # Clamp to MAX_SEARCH_RESULTS
-            results = results[:MAX_SEARCH_RESULTS]
+            ids = self._search_ids
+            apps = self._search_apps
+            masks = self._search_masks
+            qmask = 0
+            for c in query:
+                qmask |= 1 << (ord(c) & 63)
+            for i, name in enumerate(self._search_names):
+                # One AND rejects most non-matches before the substring scans
+                if (masks[i] & qmask) != qmask:
+                    continue
+                if query in name or query in ids[i]:
+                    results.append(apps[i])
+                    # Stop scanning once the page is full
+                    if len(results) >= MAX_SEARCH_RESULTS:
+                        break
             self._show_search_results(results)
         return False  # Prevent recurring GLib timeout
 
     def _on_option_change(self, *_args):
-        """Rebuild UI on relevant user options changes"""
+        """Coalesce option-driven rebuilds; a slider drag fires a notify
+        per intermediate value but only one rebuild per idle is useful"""
+        if self._pending_rebuild:
+            return
+        self._pending_rebuild = True
+        GLib.idle_add(self._do_rebuild, priority=GLib.PRIORITY_LOW)
+
+    def _do_rebuild(self) -> bool:
+        self._pending_rebuild = False
+        # Layout options are baked into the built tiles; drop the widget
+        # caches but keep the categorization data
+        self._page_widgets.clear()
+        self._reset_search_pool()
         self._populate_all_apps()
         if self._current_search_results:
             self._show_search_results(self._current_search_results)
         else:
             self._show_all_apps_page(self._current_page_index)
         self._recent_container.refresh()
+        return False
 
     def _setup_keyboard_navigation(self):
         try:
@@ -828,68 +1160,110 @@ class Launcher(widgets.Window):
             pass
         return False
 
+    def _invalidate_categorize_cache(self, *args) -> None:
+        self._categorize_cache = None
+        self._page_widgets.clear()
+        self._reset_search_pool()
+
     def _populate_all_apps(self) -> None:
-        all_apps = applications.apps
-        categorizer = AppCategorizer()
-        categorized = {category: [] for category in CATEGORIES.keys() if category != 'All'}
+        if self._categorize_cache is not None:
+            self._all_apps_pages = self._categorize_cache
+            return
 
-        for app in all_apps:
-            try:
-                categories, executable = categorizer.get_desktop_categories(app)
-                category = categorizer.categorize_app(app, categories, executable)
-                if category and category in categorized:
-                    categorized[category].append(app)
-            except Exception as e:
-                print(f"Error categorizing app {app.name}: {e}")
-                categorized['Utilities'].append(app)
+        # Wait (bounded) for the background warm-up; the per-file fallback
+        # in get_desktop_categories keeps results correct if it isn't done
+        AppCategorizer._prewarm_done.wait(timeout=2.0)
+
+        # Bind the hot classmethods to locals and build every bucket plus
+        # the 'All' list in a single pass over the app list
+        get_categories = AppCategorizer.get_desktop_categories
+        categorize = AppCategorizer.categorize_app
+        categorized: Dict[str, List[Application]] = {
+            category: [] for category in CATEGORIES if category != 'All'
+        }
+        all_apps_list: List[Application] = []
+
+        for app in applications.apps:
+            category = getattr(app, "_cached_category", None)
+            if category is None:
+                # get_desktop_categories guards its own failures and returns
+                # an empty set, so the loop needs no exception frame per app
+                categories, executable = get_categories(app)
+                category = categorize(app, categories, executable) or ''
+                # Stick the results on the wrapper so later rebuilds skip
+                # the desktop-file work and sorts skip per-call str.lower
+                app._cached_category = category
+                app._name_lower = app.name.lower()
+            bucket = categorized.get(category) if category else None
+            if bucket is not None:
+                bucket.append(app)
+                all_apps_list.append(app)
 
         result = {}
+        by_name = attrgetter("_name_lower")
 
-        all_apps_list = []
-        for apps_list in categorized.values():
-            all_apps_list.extend(apps_list)
+        # Sort each bucket in place, then merge the sorted buckets into
+        # 'All' instead of re-sorting the whole concatenation
+        for bucket in categorized.values():
+            bucket.sort(key=by_name)
 
         if all_apps_list:
-            result['All'] = sorted(all_apps_list, key=lambda x: x.name.lower())
+            result['All'] = list(
+                heapq.merge(*(b for b in categorized.values() if b), key=by_name)
+            )
 
-        for category in sorted(categorized.keys(), key=lambda cat: CATEGORIES.get(cat, {'priority': 999})['priority']):
+        for category in sorted(categorized, key=_CAT_PRI.__getitem__):
             if categorized[category]:
-                result[category] = sorted(categorized[category], key=lambda x: x.name.lower())
+                result[category] = categorized[category]
 
         self._all_apps_pages = [result] if result else [{}]
+        self._categorize_cache = self._all_apps_pages
 
     def _show_all_apps_page(self, page_index: int) -> None:
         if page_index < 0 or page_index >= len(self._all_apps_pages):
             return
         self._current_page_index = page_index
-        categorized_page = CategorizedAppsPage(self._all_apps_pages[page_index])
-        self._apps_container.child = [categorized_page]
+        page = self._page_widgets.get(page_index)
+        if page is None:
+            page = CategorizedAppsPage(self._all_apps_pages[page_index])
+            self._page_widgets[page_index] = page
+        self._apps_container.child = [page]
+
+    def _reset_search_pool(self) -> None:
+        for item in self._search_pool:
+            self._search_grid.remove(item)
+        self._search_pool.clear()
 
     def _show_search_results(self, apps: List[Application]) -> None:
         self._current_search_results = apps
 
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_hexpand(True)
-        scrolled.set_vexpand(True)
+        grid = self._search_grid
+        pool = self._search_pool
+        apps_per_row = get_apps_per_row()
 
-        grid = Gtk.Grid()
-        grid.set_row_spacing(get_app_spacing())
-        grid.set_column_spacing(get_app_spacing())
-        grid.set_hexpand(True)
-        grid.set_margin_start(16)
-        grid.set_margin_end(16)
-        grid.set_margin_top(16)
-        grid.set_margin_bottom(16)
+        # Pool positions bake in the column count; a changed option means
+        # the grid genuinely has a new shape
+        if apps_per_row != self._search_pool_per_row:
+            self._reset_search_pool()
+            self._search_pool_per_row = apps_per_row
 
-        for index, app in enumerate(apps):
-            row = index // user_options.launcher.apps_per_row
-            column = index % user_options.launcher.apps_per_row
-            app_item = LauncherAppItem(app)
-            grid.attach(app_item, column, row, 1, 1)
+        spacing = get_app_spacing()
+        grid.set_row_spacing(spacing)
+        grid.set_column_spacing(spacing)
 
-        scrolled.set_child(grid)
-        self._apps_container.child = [scrolled]
+        for index, app in enumerate(apps):
+            if index < len(pool):
+                item = pool[index]
+                item.set_app(app)
+                item.set_visible(True)
+            else:
+                item = LauncherAppItem(app)
+                pool.append(item)
+                grid.attach(item, index % apps_per_row, index // apps_per_row, 1, 1)
+        for item in pool[len(apps):]:
+            item.set_visible(False)
+
+        self._apps_container.child = [self._search_scrolled]
 
     def _on_window_open(self, *args) -> None:
         if not self.visible:
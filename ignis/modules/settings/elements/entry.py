@@ -1,3 +1,4 @@
+from typing import Callable
 from ignis import widgets
 from .page import SettingsPage
 
@@ -7,11 +8,17 @@ class SettingsEntry(widgets.ListBoxRow):
         self,
         icon: str,
         label: str,
-        page: SettingsPage,
+        page: "SettingsPage | Callable[[], SettingsPage]",
         **kwargs,
     ):
         from ..active_page import active_page  # avoid a circular import
 
+        # Pages are expensive to build (Appearance alone is a dozen rows of
+        # sliders, dialogs and bindings); passing a factory defers that to
+        # the first time the sidebar row is activated
+        self._page = None if callable(page) else page
+        self._page_factory = page if callable(page) else None
+
         super().__init__(
             child=widgets.Box(
                 child=[
@@ -20,6 +27,11 @@ class SettingsEntry(widgets.ListBoxRow):
                 ],
             ),
             css_classes=["settings-sidebar-entry"],
-            on_activate=lambda x: active_page.set_value(page),
+            on_activate=lambda x: active_page.set_value(self.get_page()),
             **kwargs,
         )
+
+    def get_page(self) -> SettingsPage:
+        if self._page is None:
+            self._page = self._page_factory()
+        return self._page
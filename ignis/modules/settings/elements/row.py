@@ -8,30 +8,37 @@ class SettingsRow(widgets.ListBoxRow):
         sublabel: str | None = None,
         **kwargs,
     ):
+        # Only build the labels a row actually has; hidden placeholder
+        # widgets still participate in measure on every resize
+        labels = []
+        if label:
+            labels.append(
+                widgets.Label(
+                    label=label,
+                    css_classes=["settings-row-label"],
+                    halign="start",
+                    vexpand=True,
+                    wrap=True,
+                )
+            )
+        if sublabel:
+            labels.append(
+                widgets.Label(
+                    label=sublabel,
+                    css_classes=["settings-row-sublabel"],
+                    halign="start",
+                    vexpand=True,
+                    wrap=True,
+                )
+            )
+
         super().__init__(
             css_classes=["settings-row"],
             child=widgets.Box(
                 child=[
                     widgets.Box(
                         vertical=True,
-                        child=[
-                            widgets.Label(
-                                label=label,
-                                css_classes=["settings-row-label"],
-                                halign="start",
-                                vexpand=True,
-                                wrap=True,
-                                visible=True if label else False,
-                            ),
-                            widgets.Label(
-                                label=sublabel,
-                                css_classes=["settings-row-sublabel"],
-                                halign="start",
-                                vexpand=True,
-                                wrap=True,
-                                visible=True if sublabel else False,
-                            ),
-                        ],
+                        child=labels,
                     )
                 ]
             ),
@@ -39,28 +39,38 @@ class SliderRow(SettingsRow):
         self._scale.set_digits(0)
         self._scale.set_draw_value(True)
         self._scale.set_size_request(slider_width, -1)
+        self._scale.set_hexpand(True)
         self._scale.set_halign(Gtk.Align.END)
         self._scale.set_valign(Gtk.Align.CENTER)
 
+        # Last value handed to on_change; the option binding echoes writes
+        # back into the scale, and GTK emits value-changed for fractional
+        # moves that round to the same int
+        self._last_reported = int(
+            value if not isinstance(value, Binding) else value.value
+        )
+
         self._scale.connect("value-changed", self._on_value_changed)
 
         if isinstance(value, Binding):
             value.bind_property("value", self._scale, "value")
 
-        # Ensure slider is pushed to right
-        spacer = Gtk.Box()
-        spacer.set_hexpand(True)
-        self.child.append(spacer)
+        # hexpand + halign END pushes the slider right without a spacer box
         self.child.append(self._scale)
 
         self._external_on_change = on_change
 
     def _on_value_changed(self, scale: Gtk.Scale) -> None:
         val = int(scale.get_value())
+        if val == self._last_reported:
+            return
+        self._last_reported = val
         if self._external_on_change:
             self._external_on_change(scale, val)
 
     def set_value(self, value: int) -> None:
+        # Programmatic updates shouldn't bounce back through on_change
+        self._last_reported = int(value)
         self._scale.set_value(value)
 
     def get_value(self) -> int:
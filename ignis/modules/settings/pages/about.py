@@ -9,6 +9,14 @@ fetch = FetchService.get_default()
 
 class AboutEntry(SettingsEntry):
     def __init__(self):
+        super().__init__(
+            label="About",
+            icon="help-about-symbolic",
+            page=self._build_page,
+        )
+
+    @staticmethod
+    def _build_page() -> SettingsPage:
         page = SettingsPage(
             name="About",
             groups=[
@@ -45,8 +53,4 @@ class AboutEntry(SettingsEntry):
                 ),
             ],
         )
-        super().__init__(
-            label="About",
-            icon="help-about-symbolic",
-            page=page,
-        )
\ No newline at end of file
+        return page
\ No newline at end of file
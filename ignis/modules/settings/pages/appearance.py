@@ -9,6 +9,14 @@ material = MaterialService.get_default()
 
 class AppearanceEntry(SettingsEntry):
     def __init__(self):
+        super().__init__(
+            label="Appearance",
+            icon="preferences-desktop-wallpaper-symbolic",
+            page=self._build_page,
+        )
+
+    @staticmethod
+    def _build_page() -> SettingsPage:
         page = SettingsPage(
             name="Appearance",
             groups=[
@@ -129,8 +137,4 @@ class AppearanceEntry(SettingsEntry):
                 )
             ],
         )
-        super().__init__(
-            label="Appearance",
-            icon="preferences-desktop-wallpaper-symbolic",
-            page=page,
-        )
+        return page
@@ -4,6 +4,14 @@ from ignis.options import options
 
 class NotificationsEntry(SettingsEntry):
     def __init__(self):
+        super().__init__(
+            label="Notifications",
+            icon="notification-symbolic",
+            page=self._build_page,
+        )
+
+    @staticmethod
+    def _build_page() -> SettingsPage:
         page = SettingsPage(
             name="Notifications",
             groups=[
@@ -38,8 +46,4 @@ class NotificationsEntry(SettingsEntry):
                 )
             ],
         )
-        super().__init__(
-            label="Notifications",
-            icon="notification-symbolic",
-            page=page,
-        )
+        return page
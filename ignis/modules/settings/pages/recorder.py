@@ -11,6 +11,14 @@ from ignis.options import options
 
 class RecorderEntry(SettingsEntry):
     def __init__(self):
+        super().__init__(
+            label="Recorder",
+            icon="media-record-symbolic",
+            page=self._build_page,
+        )
+
+    @staticmethod
+    def _build_page() -> SettingsPage:
         page = SettingsPage(
             name="Recorder",
             groups=[
@@ -42,8 +50,4 @@ class RecorderEntry(SettingsEntry):
                 )
             ],
         )
-        super().__init__(
-            label="Recorder",
-            icon="media-record-symbolic",
-            page=page,
-        )
+        return page
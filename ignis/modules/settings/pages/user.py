@@ -6,6 +6,14 @@ from user_options import user_options
 
 class UserEntry(SettingsEntry):
     def __init__(self):
+        super().__init__(
+            label="User",
+            icon="user-available-symbolic",
+            page=self._build_page,
+        )
+
+    @staticmethod
+    def _build_page() -> SettingsPage:
         page = SettingsPage(
             name="User",
             groups=[
@@ -47,8 +55,4 @@ class UserEntry(SettingsEntry):
                 ),
             ],
         )
-        super().__init__(
-            label="User",
-            icon="user-available-symbolic",
-            page=page,
-        )
+        return page
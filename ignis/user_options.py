@@ -34,9 +34,12 @@ class UserOptions(OptionsManager):
                 "tertiary": "#eabf8f",
                 # Add all other required keys as needed
             }
-            for key, value in defaults.items():
-                if key not in self.material.colors:
-                    self.material.colors[key] = value
+            colors = self.material.colors
+            missing = {k: v for k, v in defaults.items() if k not in colors}
+            if missing:
+                # One attribute assignment -> at most one save; on every
+                # startup after the first this is skipped entirely
+                self.material.colors = {**colors, **missing}
 
     class User(OptionsGroup):
         avatar: str = f"/var/lib/AccountsService/icons/{os.getenv('USER')}"